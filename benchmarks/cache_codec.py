@@ -0,0 +1,78 @@
+"""Compare the cache value encodings.
+
+legacy - JSON of JSON strings, parsed back into models on every hit
+codec  - response body bytes in the versioned, compressed format
+
+Run from the project root: python -m benchmarks.cache_codec
+"""
+
+import os
+import timeit
+import uuid
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("ES_HOST", "localhost")
+
+from orjson import orjson  # noqa: E402
+
+from src.models.film import Film  # noqa: E402
+from src.services.cache_entry import CacheEntry  # noqa: E402
+from src.services.codec import get_cache_codec  # noqa: E402
+from src.services.utils import dump_response  # noqa: E402
+
+NUMBER = 200
+
+
+def make_film(i: int) -> Film:
+    persons = [
+        {"id": str(uuid.uuid4()), "name": f"Person {i}-{j}"} for j in range(8)
+    ]
+    return Film(
+        id=str(uuid.uuid4()),
+        imdb_rating=i % 100 / 10,
+        title=f"The Star {i}",
+        description="A long time ago in a galaxy far, far away... " * 4,
+        genres=["Action", "Adventure", "Sci-Fi"],
+        url=None,
+        directors_names=[p["name"] for p in persons[:1]],
+        actors_names=[p["name"] for p in persons[1:6]],
+        writers_names=[p["name"] for p in persons[6:]],
+        directors=persons[:1],
+        actors=persons[1:6],
+        writers=persons[6:],
+    )
+
+
+def legacy_encode(films: list[Film]) -> bytes:
+    return orjson.dumps([film.json() for film in films])
+
+
+def legacy_decode(data: bytes) -> list[Film]:
+    return [Film.parse_raw(item) for item in orjson.loads(data)]
+
+
+def bench(name: str, films: list[Film]) -> None:
+    codec = get_cache_codec()
+    legacy = legacy_encode(films)
+    entry = CacheEntry(body=dump_response(films), fresh_until=0)
+    encoded = codec.encode(entry)
+
+    def timing(func) -> float:
+        return timeit.timeit(func, number=NUMBER) / NUMBER * 1e6
+
+    print(f"{name}:")
+    print(
+        f"  legacy: {len(legacy):>8} bytes, "
+        f"encode {timing(lambda: legacy_encode(films)):>8.1f} us, "
+        f"decode {timing(lambda: legacy_decode(legacy)):>8.1f} us"
+    )
+    print(
+        f"  codec:  {len(encoded):>8} bytes, "
+        f"encode {timing(lambda: codec.encode(entry)):>8.1f} us, "
+        f"decode {timing(lambda: codec.decode(encoded)):>8.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    bench("single film", [make_film(0)])
+    bench("page of 100 films", [make_film(i) for i in range(100)])
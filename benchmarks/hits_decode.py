@@ -0,0 +1,102 @@
+"""Compare the ways ES hits are turned into a response body.
+
+models - a pydantic model per hit, dumped back into dicts for orjson
+lean   - sources validated at once into plain dicts, dumped by orjson
+
+Run from the project root: python -m benchmarks.hits_decode
+"""
+
+import os
+import timeit
+import uuid
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("ES_HOST", "localhost")
+
+from orjson import orjson  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from src.models.film import Film, FilmPreview  # noqa: E402
+from src.models.persons import Person  # noqa: E402
+from src.services.elastic import get_source_adapter  # noqa: E402
+from src.services.utils import dump_response  # noqa: E402
+
+NUMBER = 200
+PAGE_SIZE = 100
+
+
+def make_film(i: int) -> dict:
+    persons = [
+        {"id": str(uuid.uuid4()), "name": f"Person {i}-{j}"} for j in range(8)
+    ]
+    return {
+        "id": str(uuid.uuid4()),
+        "imdb_rating": i % 100 / 10,
+        "title": f"The Star {i}",
+        "description": "A long time ago in a galaxy far, far away... " * 4,
+        "genres": ["Action", "Adventure", "Sci-Fi"],
+        "url": None,
+        "directors_names": [p["name"] for p in persons[:1]],
+        "actors_names": [p["name"] for p in persons[1:6]],
+        "writers_names": [p["name"] for p in persons[6:]],
+        "directors": persons[:1],
+        "actors": persons[1:6],
+        "writers": persons[6:],
+    }
+
+
+def make_person(i: int) -> dict:
+    return {
+        "person_id": str(uuid.uuid4()),
+        "full_name": f"Person {i}",
+        "films": [
+            {
+                "id": str(uuid.uuid4()),
+                "roles": ["actor"],
+                "title": f"The Star {j}",
+                "imdb_rating": j / 2,
+            }
+            for j in range(10)
+        ],
+    }
+
+
+def models_body(model: type[BaseModel], sources: list[dict]) -> bytes:
+    return orjson.dumps([model(**source).model_dump() for source in sources])
+
+
+def lean_body(model: type[BaseModel], sources: list[dict]) -> bytes:
+    return dump_response(
+        get_source_adapter(model, many=True).validate_python(sources)
+    )
+
+
+def bench(name: str, model: type[BaseModel], sources: list[dict]) -> None:
+    assert models_body(model, sources) == lean_body(model, sources)
+
+    def timing(func) -> float:
+        return timeit.timeit(func, number=NUMBER) / NUMBER * 1e6
+
+    models = timing(lambda: models_body(model, sources))
+    lean = timing(lambda: lean_body(model, sources))
+    print(f"{name}:")
+    print(f"  models: {models:>8.1f} us")
+    print(f"  lean:   {lean:>8.1f} us, saved {models - lean:>8.1f} us")
+
+
+if __name__ == "__main__":
+    films = [make_film(i) for i in range(PAGE_SIZE)]
+    bench(
+        "page of 100 film previews",
+        FilmPreview,
+        [
+            {name: film[name] for name in FilmPreview.model_fields}
+            for film in films
+        ],
+    )
+    bench("page of 100 films", Film, films)
+    bench(
+        "page of 100 persons",
+        Person,
+        [make_person(i) for i in range(PAGE_SIZE)],
+    )
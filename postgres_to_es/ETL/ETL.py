@@ -1,6 +1,8 @@
 from extractor import DBConnectionError, PsExtractor
 from loader import ESConnectionError, ESLoader
-from settings.settings import db_settings, es_settings, logger
+from publisher import CachePublisher
+from redis.exceptions import RedisError
+from settings.settings import db_settings, es_settings, index_settings, logger, redis_settings
 from state import State
 from transformer import DataTransformer
 
@@ -10,7 +12,8 @@ class ETL:
     def __init__(self, state: State) -> None:
         self.extractor = PsExtractor(db_settings)
         self.transformer = DataTransformer()
-        self.loader = ESLoader(es_settings)
+        self.loader = ESLoader(es_settings, index_settings)
+        self.publisher = CachePublisher(redis_settings)
         self.state = state
 
     def start(self) -> None:
@@ -26,9 +29,16 @@ class ETL:
             data = self.extractor.extract(state)
             transformed_data = self.transformer.transform(data)
             self.loader.load(transformed_data)
+            # состояние сдвигается только после публикации: иначе при
+            # недоступном Redis новые id не попадут в фильтр Блума
+            self.publisher.publish(transformed_data, full=not state)
             self.state.set_state()
         except (DBConnectionError, ESConnectionError) as error:
             logger.error(f'Complete ETLProcess with error: {error}')
+        except RedisError as error:
+            logger.error(f'Failed to publish cache invalidation: {error}')
         except Exception as error:
             logger.exception(f'ETL finished with error: {error}')
+        finally:
+            self.publisher.close()
         logger.info('Done')
@@ -0,0 +1,19 @@
+from hashlib import blake2b
+from typing import List
+
+
+def get_bit_positions(item: str, size: int, hashes: int) -> List[int]:
+    """
+    Позиции битов элемента в фильтре Блума заданного размера.
+
+    Должна совпадать с src/services/bloom.py, где фильтр проверяется в API.
+
+    :param item: Идентификатор документа.
+    :param size: Размер фильтра в битах.
+    :param hashes: Количество хэш-функций.
+    :return: Список позиций битов.
+    """
+    digest = blake2b(item.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'big')
+    h2 = int.from_bytes(digest[8:], 'big') | 1
+    return [(h1 + i * h2) % size for i in range(hashes)]
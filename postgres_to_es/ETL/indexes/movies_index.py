@@ -48,6 +48,9 @@ movies_index = {
       "imdb_rating": {
         "type": "float"
       },
+      "modified": {
+        "type": "date"
+      },
       "genres": {
         "type": "keyword"
       },
@@ -57,6 +60,9 @@ movies_index = {
         "fields": {
           "raw": {
             "type":  "keyword"
+          },
+          "suggest": {
+            "type": "search_as_you_type"
           }
         }
       },
@@ -120,4 +126,13 @@ movies_index = {
       }
     }
   }
-}
\ No newline at end of file
+}
+# Сортировка индекса по рейтингу: запросы с sort=-imdb_rating без
+# текстового поиска завершаются после первых size документов сегмента.
+# Порядок совпадает с сортировкой API (рейтинг, затем id). Задаётся
+# только при создании индекса, для существующего индекса нужен reindex.py.
+movies_index_sort = {
+  "index.sort.field": ["imdb_rating", "id"],
+  "index.sort.order": ["desc", "asc"],
+  "index.sort.missing": ["_last", "_last"]
+}
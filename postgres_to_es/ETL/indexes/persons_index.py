@@ -41,11 +41,16 @@ persons_index = {
   },
   "mappings": {
     "properties": {
-      "id": {
+      "person_id": {
         "type": "keyword"
       },
       "full_name": {
-        "type": "text"
+        "type": "text",
+        "fields": {
+          "suggest": {
+            "type": "search_as_you_type"
+          }
+        }
       },
       "films": {
         "type": "nested",
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict, List
+import time
+from typing import Dict, List, Set
 
 import backoff
 import elastic_transport
@@ -7,9 +8,9 @@ from elasticsearch import Elasticsearch, helpers
 
 from indexes.persons_index import persons_index
 from indexes.genres_index import genres_index
-from indexes.movies_index import movies_index
+from indexes.movies_index import movies_index, movies_index_sort
 from models import GenreModel, MovieModel
-from settings.settings import ElasticsearchSettings
+from settings.settings import ElasticsearchSettings, IndexSettings
 
 
 class ESConnectionError(Exception):
@@ -20,14 +21,19 @@ class ESConnectionError(Exception):
 class ESLoader:
     """Класс для загрузки данных в Elasticsearch."""
 
-    def __init__(self, es_settings: ElasticsearchSettings) -> None:
+    def __init__(self, es_settings: ElasticsearchSettings, index_settings: IndexSettings) -> None:
         """
         Инициализация загрузчика с настройками Elasticsearch.
 
         :param es_settings: Настройки Elasticsearch.
+        :param index_settings: Настройки индексов.
         """
         self.elastic = Elasticsearch([es_settings.dict()], timeout=5)
-        self.indexes = {"movies": movies_index, "genres": genres_index, "persons": persons_index}
+        if index_settings.movies_sort_enabled:
+            movies = {**movies_index, "settings": {**movies_index["settings"], **movies_index_sort}}
+        else:
+            movies = movies_index
+        self.indexes = {"movies": movies, "genres": genres_index, "persons": persons_index}
 
     @backoff.on_exception(
         backoff.expo,
@@ -37,7 +43,8 @@ class ESLoader:
     )
     def create_indexes(self) -> None:
         """
-        Создает индексы в Elasticsearch, если они не существуют.
+        Создает индексы в Elasticsearch, если они не существуют,
+        и добавляет в существующие индексы новые поля маппинга.
 
         :raises: ConnectionError, ConnectionTimeout
         """
@@ -47,6 +54,80 @@ class ESLoader:
                     index=index_name,
                     body=index_setting
                 )
+            else:
+                self.update_mapping(index_name, index_setting['mappings'])
+
+    @staticmethod
+    def _get_field_paths(properties: dict, prefix: str = '') -> Set[str]:
+        """
+        Собирает пути всех полей маппинга, включая подполя (fields).
+
+        :param properties: Свойства маппинга.
+        :param prefix: Путь родительского поля.
+        :return: Множество путей полей.
+        """
+        paths = set()
+        for name, field in properties.items():
+            path = f'{prefix}{name}'
+            paths.add(path)
+            paths |= ESLoader._get_field_paths(field.get('properties', {}), f'{path}.')
+            paths |= ESLoader._get_field_paths(field.get('fields', {}), f'{path}.')
+        return paths
+
+    def update_mapping(self, index_name: str, mappings: dict) -> None:
+        """
+        Добавляет в существующий индекс поля, которых в нём ещё нет.
+
+        Индексы создаются с "dynamic": "strict", поэтому без этого документы
+        с новыми полями не загружаются. Уже проиндексированные документы
+        переиндексируются на месте, чтобы заполнить новые подполя
+        (например, *.suggest). Новые поля исходных данных появятся в них
+        только после полной перезагрузки ETL.
+
+        :param index_name: Название индекса (или алиаса).
+        :param mappings: Маппинг индекса.
+        """
+        expected = self._get_field_paths(mappings['properties'])
+        for index_mapping in self.elastic.indices.get_mapping(index=index_name).values():
+            current = self._get_field_paths(index_mapping['mappings'].get('properties', {}))
+            if expected <= current:
+                continue
+            logging.info(f'Обновление маппинга {index_name}: {sorted(expected - current)}')
+            self.elastic.indices.put_mapping(index=index_name, body=mappings)
+            self.elastic.update_by_query(index=index_name, conflicts='proceed', wait_for_completion=False)
+            return
+
+    def reindex(self, index_name: str) -> str:
+        """
+        Пересоздаёт индекс с текущими настройками и переносит в него документы.
+
+        Настройки вроде сортировки индекса задаются только при создании,
+        поэтому документы копируются через _reindex в новый индекс
+        с суффиксом времени, а имя index_name становится его алиасом.
+        Старый индекс удаляется в той же атомарной операции с алиасами.
+
+        :param index_name: Название индекса (или алиаса).
+        :return: Название нового индекса.
+        """
+        new_index = f'{index_name}_{int(time.time())}'
+        self.elastic.indices.create(index=new_index, body=self.indexes[index_name])
+        self.elastic.options(request_timeout=None).reindex(
+            source={'index': index_name},
+            dest={'index': new_index},
+            refresh=True,
+            wait_for_completion=True,
+        )
+        if self.elastic.indices.exists_alias(name=index_name):
+            old_indexes = list(self.elastic.indices.get_alias(name=index_name))
+            actions = [{'remove': {'index': index, 'alias': index_name}} for index in old_indexes]
+        else:
+            old_indexes = []
+            actions = [{'remove_index': {'index': index_name}}]
+        actions.append({'add': {'index': new_index, 'alias': index_name}})
+        self.elastic.indices.update_aliases(actions=actions)
+        for index in old_indexes:
+            self.elastic.indices.delete(index=index)
+        return new_index
 
     @backoff.on_exception(
         backoff.expo,
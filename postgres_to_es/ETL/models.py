@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Dict, List
 
 from pydantic import BaseModel, Field
@@ -26,6 +27,7 @@ class MovieModel(BaseModel):
     persons: List[PersonModel] | None = Field(exclude=True)
     description: str | None
     url: str | None = Field(default=None)
+    modified: datetime | None = Field(default=None)
 
     def _get_persons_by_role(self, role: str) -> List[PersonModel]:
         """Filter persons by role."""
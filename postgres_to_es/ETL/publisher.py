@@ -0,0 +1,100 @@
+import json
+from typing import Dict, List
+
+import backoff
+from bloom import get_bit_positions
+from redis import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+from models import GenreModel, MovieModel, PersonModel
+from settings.settings import RedisSettings
+
+
+class CachePublisher:
+    """Класс для оповещения API об изменённых документах.
+
+    После каждой успешной загрузки в Elasticsearch id документов
+    добавляются в фильтр Блума индекса, версия пространства ключей
+    увеличивается (ей инвалидируются кэши списков) и в канал
+    публикуются id изменённых документов.
+    """
+
+    def __init__(self, redis_settings: RedisSettings) -> None:
+        """
+        Инициализация публикатора с настройками Redis.
+
+        :param redis_settings: Настройки Redis.
+        """
+        self.redis = Redis(
+            host=redis_settings.host,
+            port=redis_settings.port,
+            socket_timeout=5,
+        )
+        self.channel = redis_settings.invalidation_channel
+        self.bloom_filter_size = redis_settings.bloom_filter_size
+        self.bloom_filter_hashes = redis_settings.bloom_filter_hashes
+
+    @staticmethod
+    def _get_ids(
+        index_name: str, items: List[MovieModel | GenreModel | PersonModel]
+    ) -> List[str]:
+        return [
+            item.person_id if index_name == 'persons' else item.id
+            for item in items
+        ]
+
+    def _add_to_bloom_filter(self, index_name: str, ids: List[str]) -> None:
+        """
+        Добавляет id документов в фильтр Блума индекса.
+
+        :param index_name: Название индекса.
+        :param ids: Идентификаторы документов.
+        """
+        key = f'bloom: {index_name}'
+        pipe = self.redis.pipeline(transaction=False)
+        for id in ids:
+            positions = get_bit_positions(
+                id, self.bloom_filter_size, self.bloom_filter_hashes
+            )
+            for position in positions:
+                pipe.setbit(key, position, 1)
+        pipe.execute()
+
+    @backoff.on_exception(
+        backoff.expo,
+        (ConnectionError, TimeoutError),
+        max_tries=5,
+        max_time=5,
+    )
+    def publish(
+        self,
+        data: Dict[str, List[MovieModel | GenreModel | PersonModel]],
+        full: bool = False,
+    ) -> None:
+        """
+        Публикует id изменённых документов по каждому индексу.
+
+        :param data: Загруженные в Elasticsearch данные.
+        :param full: Данные загружены полностью, а не по изменениям.
+        :raises: ConnectionError, TimeoutError
+        """
+        for index_name, items in data.items():
+            if not items:
+                continue
+            ids = self._get_ids(index_name, items)
+            self._add_to_bloom_filter(index_name, ids)
+            if full:
+                # фильтр содержит все документы индекса,
+                # API может им пользоваться
+                self.redis.set(f'bloom: {index_name}: complete', 1)
+            version = self.redis.incr(f'cache_version: {index_name}')
+            message = {
+                'index': index_name,
+                'ids': ids,
+                'version': version,
+                'full': full,
+            }
+            self.redis.publish(self.channel, json.dumps(message))
+
+    def close(self) -> None:
+        self.redis.close()
@@ -0,0 +1,18 @@
+import sys
+
+from loader import ESLoader
+from settings.settings import es_settings, index_settings, logger
+
+# Пересоздание индекса с текущими настройками, например чтобы включить
+# сортировку индекса фильмов (MOVIES_INDEX_SORT_ENABLED):
+#   docker compose run --rm --entrypoint python etl reindex.py movies
+
+
+if __name__ == '__main__':
+    loader = ESLoader(es_settings, index_settings)
+    try:
+        for index_name in sys.argv[1:] or ['movies']:
+            new_index = loader.reindex(index_name)
+            logger.info(f'Index {index_name} reindexed into {new_index}')
+    finally:
+        loader.elastic.close()
@@ -41,8 +41,30 @@ class ElasticsearchSettings(BaseSettings):
         extra = Extra.ignore
 
 
+class IndexSettings(BaseSettings):
+    movies_sort_enabled: bool = Field(False, alias='MOVIES_INDEX_SORT_ENABLED')
+
+    class Config:
+        env_file = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
+        extra = Extra.ignore
+
+
+class RedisSettings(BaseSettings):
+    host: str = Field(alias='REDIS_HOST')
+    port: int = Field(6379, alias='REDIS_PORT')
+    invalidation_channel: str = Field('cache_invalidation', alias='CACHE_INVALIDATION_CHANNEL')
+    bloom_filter_size: int = Field(2 ** 24, alias='BLOOM_FILTER_SIZE')
+    bloom_filter_hashes: int = Field(7, alias='BLOOM_FILTER_HASHES')
+
+    class Config:
+        env_file = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
+        extra = Extra.ignore
+
+
 db_settings = PostgresDBSettings()
 es_settings = ElasticsearchSettings()
+index_settings = IndexSettings()
+redis_settings = RedisSettings()
 file_api_settings = FileApiSettings()
 
 SQL_MODIFIED_QUERY = """SELECT
@@ -62,7 +84,8 @@ SQL_MODIFIED_QUERY = """SELECT
        ) FILTER (WHERE p.id is not null),
        '[]'
    ) as persons,
-   array_agg(DISTINCT g.name) as genres
+   array_agg(DISTINCT g.name) as genres,
+   GREATEST(fw.updated_at, MAX(g.updated_at), MAX(p.updated_at)) as modified
 FROM content.film_work fw
 LEFT JOIN content.person_film_work pfw ON pfw.film_work_id = fw.id
 LEFT JOIN content.person p ON p.id = pfw.person_id
@@ -90,7 +113,8 @@ SELECT
        ) FILTER (WHERE p.id is not null),
        '[]'
    ) as persons,
-   array_agg(DISTINCT g.name) as genres
+   array_agg(DISTINCT g.name) as genres,
+   GREATEST(fw.updated_at, MAX(g.updated_at), MAX(p.updated_at)) as modified
 FROM content.film_work fw
 LEFT JOIN content.person_film_work pfw ON pfw.film_work_id = fw.id
 LEFT JOIN content.person p ON p.id = pfw.person_id
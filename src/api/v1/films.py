@@ -1,21 +1,95 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
-from src.models.film import Film, FilmPreview
-from src.models.filters import FilmSearching, FilmsGenreFilter
+from src.api.v1.responses import batch_response, cached_response
+from src.models.batch import BatchItem, BatchRequest
+from src.models.film import Film, FilmFacets, FilmPreview
+from src.models.filters import (
+    FilmFacetsFilter,
+    FilmSearching,
+    FilmsExportParams,
+    FilmsGenreFilter,
+)
 from src.services.film import FilmService, get_film_service
 
 router = APIRouter()
 
 
+# объявлены до /{film_id}, иначе "facets" и "export" будут приняты
+# за id фильма
+@router.get(
+    "/facets",
+    response_model=FilmFacets,
+    summary="Count films by genre and rating",
+)
+async def film_facets(
+    request: Request,
+    params: Annotated[FilmFacetsFilter, Query(description="Query params")],
+    film_service: FilmService = Depends(get_film_service),
+) -> Response:
+    """
+    Fetch the number of films per genre and a histogram of IMDb
+    ratings (buckets of one point) without loading the films.
+    Accepts the same query and filters as the films search.
+    """
+    facets = await film_service.facets(
+        query=params.query,
+        genre=params.genre,
+        min_rating=params.min_rating,
+        max_rating=params.max_rating,
+    )
+    return cached_response(request, facets)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export the whole film catalogue as NDJSON",
+)
+async def export_films(
+    params: Annotated[FilmsExportParams, Query(description="Query params")],
+    film_service: FilmService = Depends(get_film_service),
+) -> StreamingResponse:
+    """
+    Stream all films, one JSON document per line, read from a snapshot
+    of the index. Export only the given fields and only films changed
+    since the given time to sync a copy of the catalogue incrementally.
+    """
+    chunks = await film_service.export(
+        fields=params.fields, changed_since=params.changed_since
+    )
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+
+@router.post(
+    "/batch",
+    response_model=list[BatchItem[Film]],
+    summary="Retrieve details of many films by IDs",
+)
+async def films_batch(
+    batch: BatchRequest,
+    film_service: FilmService = Depends(get_film_service),
+) -> Response:
+    """
+    Fetch detailed information about several films at once, e.g.
+    for a watchlist. Results come in the order of the given IDs,
+    a film that does not exist is marked with found=false.
+    """
+    films = await film_service.get_many_by_id(batch.ids)
+    return batch_response(batch.ids, films)
+
+
 @router.get(
     "/{film_id}", response_model=Film, summary="Retrieve film details by ID"
 )
 async def film_details(
-    film_id: str, film_service: FilmService = Depends(get_film_service)
-) -> Film:
+    request: Request,
+    film_id: str,
+    film_service: FilmService = Depends(get_film_service),
+) -> Response:
     """
     Fetch detailed information about a film, including title,
     genres, imdb rating, actors, and other information
@@ -27,7 +101,7 @@ async def film_details(
             status_code=HTTPStatus.NOT_FOUND, detail="film not found"
         )
 
-    return Film(**film.model_dump(by_alias=True))
+    return cached_response(request, film)
 
 
 @router.get(
@@ -36,22 +110,28 @@ async def film_details(
     summary="Retrieve a list of films with pagination and filters",
 )
 async def get_films(
+    request: Request,
     params: Annotated[FilmsGenreFilter, Query(description="Query params")],
     film_service: FilmService = Depends(get_film_service),
-) -> list[Film]:
+) -> Response:
     """
     Fetch a paginated list of films with optional sorting by fields
-    like IMDb rating and optional filtering by genre.
+    like IMDb rating and optional filtering by genre and rating range.
     The response contains a film id, and basic details
-    like title and rating.
+    like title and rating. A full page comes with an X-Next-Cursor
+    header: pass it as the cursor param to fetch the next page
+    at a constant cost, however deep it is.
     """
     films = await film_service.all(
         page_size=params.page_size,
         page=params.page,
         sort=params.sort,
         genre=params.genre,
+        min_rating=params.min_rating,
+        max_rating=params.max_rating,
+        cursor=params.cursor,
     )
-    return films
+    return cached_response(request, films)
 
 
 @router.get(
@@ -60,19 +140,24 @@ async def get_films(
     summary="Search films by title with pagination and sorting",
 )
 async def search_films_by_title(
+    request: Request,
     params: Annotated[FilmSearching, Query(description="Query params")],
     film_service: FilmService = Depends(get_film_service),
-) -> list[FilmPreview]:
+) -> Response:
     """
     Perform a search for films by their title. Supports pagination
     for managing large result sets and allows sorting
     by fields such as IMDb rating. The response contains a film id,
-    and basic details like title and imdb rating.
+    and basic details like title and imdb rating. A full page comes
+    with an X-Next-Cursor header for cursor pagination.
     """
     films = await film_service.all(
         page_size=params.page_size,
         page=params.page,
         sort=params.sort,
         query=params.query,
+        min_rating=params.min_rating,
+        max_rating=params.max_rating,
+        cursor=params.cursor,
     )
-    return films
+    return cached_response(request, films)
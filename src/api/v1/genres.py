@@ -1,8 +1,11 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 
+from src.api.v1.responses import batch_response, cached_response
+from src.models.batch import BatchItem, BatchRequest
 from src.models.filters import Pagination
 from src.models.genre import Genre
 from src.services.genre import GenreService, get_genre_service
@@ -16,9 +19,10 @@ router = APIRouter()
     summary="Retrieve a list of film genres with pagination",
 )
 async def get_genres(
+    request: Request,
     params: Annotated[Pagination, Query(description="Query params")],
     genre_service: GenreService = Depends(get_genre_service),
-) -> list[Genre]:
+) -> Response:
     """
     Fetch a paginated list of available film genres.
     Supports pagination to navigate through large sets of genres,
@@ -27,15 +31,35 @@ async def get_genres(
     films = await genre_service.all(
         page_size=params.page_size, page=params.page
     )
-    return films
+    return cached_response(request, films)
+
+
+@router.post(
+    "/batch",
+    response_model=list[BatchItem[Genre]],
+    summary="Retrieve details of many genres by IDs",
+)
+async def genres_batch(
+    batch: BatchRequest,
+    genre_service: GenreService = Depends(get_genre_service),
+) -> Response:
+    """
+    Fetch information about several genres at once. Results come
+    in the order of the given IDs, a genre that does not exist
+    is marked with found=false.
+    """
+    genres = await genre_service.get_many_by_id(batch.ids)
+    return batch_response(batch.ids, genres)
 
 
 @router.get(
     "/{genre_id}", response_model=Genre, summary="Retrieve genre details by ID"
 )
 async def genre_details(
-    genre_id: str, genre_service: GenreService = Depends(get_genre_service)
-) -> Genre:
+    request: Request,
+    genre_id: str,
+    genre_service: GenreService = Depends(get_genre_service),
+) -> Response:
     """
     Fetch information (id, name and description) about a specific
     genre by providing its unique genre ID. If the genre is not found,
@@ -46,4 +70,4 @@ async def genre_details(
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="genre not found"
         )
-    return genre.model_dump()
+    return cached_response(request, genre)
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.elastic import get_elastic_circuit_breaker
+from src.services.local_cache import LocalCache, get_local_cache
+
+router = APIRouter()
+
+
+@router.get("/", summary="Cache and Elasticsearch health counters")
+async def metrics(
+    breaker: CircuitBreaker = Depends(get_elastic_circuit_breaker),
+    local_cache: LocalCache = Depends(get_local_cache),
+) -> dict:
+    """
+    Return the state of the Elasticsearch circuit breaker (closed, open
+    or half_open) with call, failure and rejection counters, and the
+    in-process cache statistics. Counters are per worker process.
+    """
+    return {
+        "elasticsearch_circuit_breaker": breaker.stats(),
+        "local_cache": local_cache.stats(),
+    }
@@ -1,8 +1,12 @@
 
 from http import HTTPStatus
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 from uuid import UUID
+from src.api.v1.responses import batch_response, cached_response
+from src.models.batch import BatchItem, BatchRequest
+from src.enums import FilmsSortOption
 from src.models.persons import Person, FilmsByPerson
 from src.services.persons import PersonService, get_person_service
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -14,21 +18,32 @@ router = APIRouter()
 @router.get('/search', response_model=list[Person], summary='Search persons by name with pagination'
 )
 async def get_persons(
+        request: Request,
         page_size: Annotated[int, Query(description='Pagination page size', ge=1)] = 10,
         page: Annotated[int, Query(description='Pagination page number', ge=1)] = 1,
         query: Annotated[str, Query(description='Search by person name')] = '',
         person_service: PersonService = Depends(get_person_service)
-) -> list[Person]:
+) -> Response:
     """
     Perform a search for persons by their optional name. Supports pagination to handle large result sets.
     The response includes id, full name, films, and the person's specific role in each film, such as actor, writer, etc.
     """
     persons = await person_service.all(page_size=page_size, page=page, query=query)
-    return persons
+    return cached_response(request, persons)
+
+
+@router.post('/batch', response_model=list[BatchItem[Person]], summary='Retrieve details of many persons by IDs')
+async def persons_batch(batch: BatchRequest, person_service: PersonService = Depends(get_person_service)) -> Response:
+    """
+    Fetch detailed information about several persons at once, e.g. to render the credits of a film.
+    Results come in the order of the given IDs, a person that does not exist is marked with found=false.
+    """
+    persons = await person_service.get_many_by_id(batch.ids)
+    return batch_response(batch.ids, persons)
 
 
 @router.get('/{person_id}', response_model=Person, summary='Retrieve person details by ID')
-async def person_details(person_id: str, person_service: PersonService = Depends(get_person_service)) -> Person:
+async def person_details(request: Request, person_id: str, person_service: PersonService = Depends(get_person_service)) -> Response:
     """
     Fetch detailed information (including ID, full name, films, and the person's specific role in each film,
     such as actor, writer, etc.) about a specific person by providing their unique person ID.
@@ -37,17 +52,27 @@ async def person_details(person_id: str, person_service: PersonService = Depends
     person = await person_service.get_by_id(person_id)
     if not person:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='person not found')
-    return person.model_dump()
+    return cached_response(request, person)
 
 
 @router.get('/{person_id}/film', response_model=list[FilmsByPerson],
             summary='Retrieve films related to a specific person')
-async def films_by_person(person_id: str, person_service: PersonService = Depends(get_person_service)):
+async def films_by_person(
+        request: Request,
+        person_id: str,
+        sort: Annotated[FilmsSortOption | None, Query(description='Sort films by rating value')] = None,
+        page_size: Annotated[
+            int | None, Query(description='Pagination page size, all films if not set', ge=1, le=100)
+        ] = None,
+        page: Annotated[int, Query(description='Pagination page number', ge=1)] = 1,
+        person_service: PersonService = Depends(get_person_service)
+) -> Response:
     """
     Fetch a list of films in which a specific person was involved, based on their unique person ID.
+    Films can be sorted by rating and paginated, without page_size all films are returned.
     If the person or films are not found, a 404 error will be returned.
     """
-    films = await person_service.get_films_by_person(person_id)
+    films = await person_service.get_films_by_person(person_id, sort=sort, page=page, page_size=page_size)
     if not films:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='person or films by person  not found')
-    return films
+    return cached_response(request, films)
@@ -0,0 +1,111 @@
+import time
+from http import HTTPStatus
+
+from fastapi import Request
+from fastapi.responses import Response
+from orjson import orjson
+
+from src.core.config import settings
+from src.services.cache_entry import ETAG_HEADER, CacheEntry
+
+
+class RawJSONResponse(Response):
+    """Response for an already serialized JSON body.
+
+    Used on the cache fast path: the body comes from Redis as is,
+    without building and validating response models.
+    """
+
+    media_type = "application/json"
+
+
+def _etag_matches(if_none_match: str | None, *etags: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    return any(
+        tag.strip().removeprefix("W/") in etags
+        for tag in if_none_match.split(",")
+    )
+
+
+def _accepted_encodings(accept_encoding: str | None) -> dict[str, float]:
+    """Content codings accepted by the client with their q-values."""
+    accepted = {}
+    for coding in (accept_encoding or "").lower().split(","):
+        name, _, params = coding.partition(";")
+        _, _, quality = params.partition("q=")
+        try:
+            accepted[name.strip()] = float(quality or 1)
+        except ValueError:
+            continue
+    return accepted
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    # another representation of the same entity needs another strong tag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def cached_response(request: Request, entry: CacheEntry) -> Response:
+    """Response for a cache entry with ETag and Cache-Control.
+
+    Clients and proxies may reuse the response while the entry is
+    fresh; after that they revalidate it with If-None-Match and get
+    304 Not Modified without the body if the entry has not changed.
+    The brotli or gzip variant of the body is sent as is to clients
+    accepting it, brotli first, so a cache hit is neither serialized
+    nor compressed.
+    """
+    variants = {"br": entry.br_body, "gzip": entry.gzip_body}
+    etags = (
+        entry.etag,
+        *(_encoded_etag(entry.etag, name) for name in variants),
+    )
+    accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+    etag, body, encoding = etags[0], entry.body, {}
+    # the highest q-value wins, brotli on a tie: max keeps the first
+    candidates = [
+        name
+        for name, variant in variants.items()
+        if variant is not None and accepted.get(name, 0) > 0
+    ]
+    if candidates:
+        name = max(candidates, key=lambda name: accepted[name])
+        etag, body = _encoded_etag(entry.etag, name), variants[name]
+        encoding = {"Content-Encoding": name}
+    max_age = int(
+        min(
+            max(entry.fresh_until - time.time(), 0),
+            settings.cache_expire_in_seconds,
+        )
+    )
+    headers = {
+        **entry.headers,
+        ETAG_HEADER: etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), *etags):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return RawJSONResponse(body, headers={**headers, **encoding})
+
+
+def batch_response(
+    ids: list[str], bodies: list[bytes | None]
+) -> RawJSONResponse:
+    """Batch results in the order of ids, built from cached bodies.
+
+    Every id gets an item: the document, or found=false if there is
+    no such document.
+    """
+    items = [
+        b'{"id":'
+        + orjson.dumps(id)
+        + (b',"found":true,"item":' + body if body else b',"found":false')
+        + b"}"
+        for id, body in zip(ids, bodies)
+    ]
+    return RawJSONResponse(b"[" + b",".join(items) + b"]")
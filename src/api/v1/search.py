@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+
+from src.api.v1.responses import cached_response
+from src.models.search import SearchParams, SearchResults
+from src.services.search import SearchService, get_search_service
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=SearchResults,
+    summary="Search films, persons and genres at once",
+)
+async def search(
+    request: Request,
+    params: Annotated[SearchParams, Query(description="Query params")],
+    search_service: SearchService = Depends(get_search_service),
+) -> Response:
+    """
+    Search films by title, persons by full name and genres by name
+    with a single request. Results are grouped by type, pagination
+    applies to each group. Replaces separate calls to the films,
+    persons and genres search endpoints when rendering one page.
+    """
+    results = await search_service.search(
+        query=params.query, page_size=params.page_size, page=params.page
+    )
+    return cached_response(request, results)
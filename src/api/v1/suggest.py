@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+
+from src.api.v1.responses import cached_response
+from src.models.suggest import SuggestParams, Suggestions
+from src.services.suggest import SuggestService, get_suggest_service
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=Suggestions,
+    summary="Suggest films and persons for a typed prefix",
+)
+async def suggest(
+    request: Request,
+    params: Annotated[SuggestParams, Query(description="Query params")],
+    suggest_service: SuggestService = Depends(get_suggest_service),
+) -> Response:
+    """
+    Autocomplete for a search box: returns a few films (id and title)
+    and persons (id and full name) whose names start with the typed
+    text. Meant to be called on every keystroke, results are cached
+    per prefix.
+    """
+    suggestions = await suggest_service.suggest(
+        query=params.query, size=params.size
+    )
+    return cached_response(request, suggestions)
@@ -20,6 +20,18 @@ class Settings(BaseSettings):
     es_schema: str = Field("http://", alias="ES_SCHEMA")
     es_host: str = Field(..., alias="ES_HOST")
     es_port: int = Field(9200, alias="ES_PORT")
+    es_lookup_timeout_in_seconds: float = Field(
+        1, alias="ES_LOOKUP_TIMEOUT_IN_SECONDS"
+    )
+    es_search_timeout_in_seconds: float = Field(
+        3, alias="ES_SEARCH_TIMEOUT_IN_SECONDS"
+    )
+    es_breaker_failure_threshold: int = Field(
+        5, alias="ES_BREAKER_FAILURE_THRESHOLD"
+    )
+    es_breaker_reset_timeout_in_seconds: float = Field(
+        10, alias="ES_BREAKER_RESET_TIMEOUT_IN_SECONDS"
+    )
     movies_index_name: str = Field("movies", alias="MOVIES_INDEX_NAME")
     genres_index_name: str = Field("genres", alias="GENRES_INDEX_NAME")
     persons_index_name: str = Field("persons", alias="PERSONS_INDEX_NAME")
@@ -27,6 +39,73 @@ class Settings(BaseSettings):
     cache_expire_in_seconds: int = Field(
         60 * 5, alias="CACHE_EXPIRE_IN_SECONDS"
     )
+    # глобальная версия ключей кэша, её смена сбрасывает весь кэш
+    cache_version: str = Field("v1", alias="CACHE_VERSION")
+    # сколько ещё отдавать устаревшее значение, пока оно обновляется в фоне
+    cache_stale_in_seconds: int = Field(
+        60 * 10, alias="CACHE_STALE_IN_SECONDS"
+    )
+    # устаревшие ответы хранятся дольше, чтобы отдавать их, пока ES недоступен
+    cache_fallback_in_seconds: int = Field(
+        86400, alias="CACHE_FALLBACK_IN_SECONDS"
+    )
+    # списки меняют ключ с каждой загрузкой ETL, поэтому хранятся недолго
+    cache_list_fallback_in_seconds: int = Field(
+        60 * 10, alias="CACHE_LIST_FALLBACK_IN_SECONDS"
+    )
+    # пустые записи для несуществующих id, чтобы не ходить за ними в ES
+    cache_not_found_expire_in_seconds: int = Field(
+        30, alias="CACHE_NOT_FOUND_EXPIRE_IN_SECONDS"
+    )
+    bloom_filter_enabled: bool = Field(False, alias="BLOOM_FILTER_ENABLED")
+    bloom_filter_size: int = Field(2**24, alias="BLOOM_FILTER_SIZE")
+    bloom_filter_hashes: int = Field(7, alias="BLOOM_FILTER_HASHES")
+    cache_compress_min_size: int = Field(
+        1024, alias="CACHE_COMPRESS_MIN_SIZE"
+    )
+    cache_compress_level: int = Field(1, alias="CACHE_COMPRESS_LEVEL")
+    # качество brotli-варианта, без значения он не хранится
+    cache_brotli_quality: int | None = Field(
+        4, alias="CACHE_BROTLI_QUALITY"
+    )
+    cache_invalidation_channel: str = Field(
+        "cache_invalidation", alias="CACHE_INVALIDATION_CHANNEL"
+    )
+    warmup_on_startup: bool = Field(True, alias="WARMUP_ON_STARTUP")
+    warmup_pages: int = Field(3, alias="WARMUP_PAGES")
+    warmup_page_size: int = Field(10, alias="WARMUP_PAGE_SIZE")
+    warmup_top_films: int = Field(100, alias="WARMUP_TOP_FILMS")
+    warmup_concurrency: int = Field(10, alias="WARMUP_CONCURRENCY")
+    local_cache_max_size: int = Field(10_000, alias="LOCAL_CACHE_MAX_SIZE")
+    local_cache_expire_in_seconds: int = Field(
+        10, alias="LOCAL_CACHE_EXPIRE_IN_SECONDS"
+    )
+    cache_lock_enabled: bool = Field(False, alias="CACHE_LOCK_ENABLED")
+    cache_lock_timeout_in_seconds: float = Field(
+        10, alias="CACHE_LOCK_TIMEOUT_IN_SECONDS"
+    )
+    # сколько при старте ждать загрузки версий ключей из Redis
+    cache_versions_wait_in_seconds: float = Field(
+        5, alias="CACHE_VERSIONS_WAIT_IN_SECONDS"
+    )
+    cache_lock_wait_in_seconds: float = Field(
+        5, alias="CACHE_LOCK_WAIT_IN_SECONDS"
+    )
+    genres_snapshot_enabled: bool = Field(
+        True, alias="GENRES_SNAPSHOT_ENABLED"
+    )
+    genres_refresh_interval_in_seconds: int = Field(
+        300, alias="GENRES_REFRESH_INTERVAL_IN_SECONDS"
+    )
+    genres_snapshot_max_size: int = Field(
+        10_000, alias="GENRES_SNAPSHOT_MAX_SIZE"
+    )
+    cursor_pit_enabled: bool = Field(False, alias="CURSOR_PIT_ENABLED")
+    cursor_pit_keep_alive: str = Field("1m", alias="CURSOR_PIT_KEEP_ALIVE")
+    films_export_batch_size: int = Field(
+        1000, alias="FILMS_EXPORT_BATCH_SIZE"
+    )
+    batch_max_size: int = Field(100, alias="BATCH_MAX_SIZE")
 
 
 settings = Settings()
@@ -1,19 +1,87 @@
+import asyncio
+import logging
+from http import HTTPStatus
+
 from elasticsearch import AsyncElasticsearch
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import ORJSONResponse
 from redis.asyncio import Redis
-from src.api.v1 import films, genres, persons
+from src.api.v1 import films, genres, metrics, persons, search, suggest
 from src.db import elastic, redis
 from src.core.config import settings
+from src.services.codec import get_cache_codec
+from src.services.cursor import InvalidCursorError
+from src.services.elastic import (
+    ElasticUnavailableError,
+    get_elastic_circuit_breaker,
+    get_elastic_service,
+)
+from src.services.film import get_film_service
+from src.services.genre import get_genre_service
+from src.services.invalidation import CacheInvalidationListener
+from src.services.local_cache import get_local_cache
+from src.services.redis import get_redis_service
+from src.services.warmup import CacheWarmer
 from contextlib import asynccontextmanager
 
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     redis.redis = Redis(host=settings.redis_host, port=settings.redis_port)
     elastic.es = AsyncElasticsearch(hosts=[f'{settings.es_schema}{settings.es_host}:{settings.es_port}'])
+    redis_service = get_redis_service(
+        redis=redis.redis,
+        local_cache=get_local_cache(),
+        codec=get_cache_codec(),
+    )
+    elastic_service = get_elastic_service(
+        elastic=elastic.es, breaker=get_elastic_circuit_breaker()
+    )
+    genre_service = get_genre_service(
+        redis_service=redis_service, elastic_service=elastic_service
+    )
+    warmer = CacheWarmer(
+        get_film_service(
+            redis_service=redis_service, elastic_service=elastic_service
+        ),
+        genre_service,
+    )
+
+    async def warm_up_after_reindex(event: dict) -> None:
+        # после полной переиндексации фильмов кэш прогревается заново
+        if event.get("full") and event["index"] == settings.movies_index_name:
+            warmer.schedule()
+
+    async def refresh_genres(event: dict) -> None:
+        if event["index"] == settings.genres_index_name:
+            await genre_service.refresh()
+
+    listener = CacheInvalidationListener(redis_service)
+    listener.add_handler(warm_up_after_reindex)
+    background_tasks = [asyncio.create_task(listener.run())]
+    # без версий ключи списков строились бы с :v0: и терялись при обновлении
+    try:
+        await asyncio.wait_for(
+            listener.ready.wait(), settings.cache_versions_wait_in_seconds
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Cache versions are not loaded, Redis is unavailable")
+    if settings.genres_snapshot_enabled:
+        listener.add_handler(refresh_genres)
+        # снимок жанров загружается до прогрева, прогрев читает жанры из него
+        await genre_service.refresh()
+        background_tasks.append(
+            asyncio.create_task(genre_service.refresh_periodically())
+        )
+    if settings.warmup_on_startup:
+        warmer.schedule()
     yield
+    await warmer.cancel()
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
     await redis.redis.close()
     await elastic.es.close()
 
@@ -26,7 +94,33 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+@app.exception_handler(ElasticUnavailableError)
+async def elastic_unavailable_handler(
+    request: Request, exc: ElasticUnavailableError
+) -> ORJSONResponse:
+    # без кэшированного ответа запрос сразу завершается, а не ждёт ES
+    return ORJSONResponse(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        content={"detail": "search is temporarily unavailable"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(
+    request: Request, exc: InvalidCursorError
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc)},
+    )
+
+
 app.include_router(films.router, prefix='/api/v1/films', tags=['films'])
 app.include_router(genres.router, prefix='/api/v1/genres', tags=['genres'])
 app.include_router(persons.router, prefix='/api/v1/persons', tags=['persons'])
+app.include_router(search.router, prefix='/api/v1/search', tags=['search'])
+app.include_router(suggest.router, prefix='/api/v1/suggest', tags=['suggest'])
+app.include_router(metrics.router, prefix='/api/v1/metrics', tags=['metrics'])
 
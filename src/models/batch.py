@@ -0,0 +1,23 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+from src.core.config import settings
+
+Document = TypeVar("Document")
+
+
+class BatchRequest(BaseModel):
+    ids: list[str] = Field(
+        min_length=1,
+        max_length=settings.batch_max_size,
+        description="Document ids, results keep their order",
+    )
+
+
+class BatchItem(BaseModel, Generic[Document]):
+    """Результат пакетного запроса по одному id, found=false без item"""
+
+    id: str
+    found: bool
+    item: Document | None = None
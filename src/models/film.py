@@ -1,3 +1,4 @@
+from datetime import datetime
 
 # Используем pydantic для упрощения работы при перегонке данных из json в объекты
 from pydantic import BaseModel
@@ -50,3 +51,25 @@ class Film(BaseModel):
     actors: list[PersonEntity]
     writers: list[PersonEntity]
 
+
+class FilmExport(Film):
+    """Фильм в выгрузке каталога, с временем последнего изменения"""
+    modified: datetime | None = None
+
+
+class GenreFacet(BaseModel):
+    genre: str
+    count: int
+
+
+class RatingFacet(BaseModel):
+    """Число фильмов с рейтингом от rating до rating + 1"""
+    rating: float
+    count: int
+
+
+class FilmFacets(BaseModel):
+    """Распределение найденных фильмов по жанрам и рейтингу"""
+    total: int
+    genres: list[GenreFacet]
+    ratings: list[RatingFacet]
@@ -1,6 +1,10 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from src.enums import FilmsSortOption
+from src.models.film import FilmExport
+from src.services.cursor import Cursor
 
 
 class Pagination(BaseModel):
@@ -14,13 +18,74 @@ class FilmsSorting(BaseModel):
     )
 
 
-class FilmsGenreFilter(Pagination, FilmsSorting):
+class FilmsPagination(Pagination, FilmsSorting):
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor of the next page from the X-Next-Cursor "
+        "header, page is ignored if it is set",
+    )
+
+    @field_validator("cursor")
+    @classmethod
+    def check_cursor(cls, cursor: str | None):
+        # the sort order is checked against the cursor by the search
+        if cursor:
+            Cursor.decode(cursor)
+        return cursor
+
+
+class FilmsRatingFilter(BaseModel):
+    min_rating: float | None = Field(
+        default=None, ge=0, le=10, description="Minimal film rating"
+    )
+    max_rating: float | None = Field(
+        default=None, ge=0, le=10, description="Maximal film rating"
+    )
+
+    @model_validator(mode="after")
+    def check_rating_range(self):
+        if (
+            self.min_rating is not None
+            and self.max_rating is not None
+            and self.min_rating > self.max_rating
+        ):
+            raise ValueError("min_rating is greater than max_rating")
+        return self
+
+
+class FilmsGenreFilter(FilmsPagination, FilmsRatingFilter):
     genre: str | None = Field(
         default=None, description="Filter films by genre name"
     )
 
 
-class FilmSearching(Pagination, FilmsSorting):
+class FilmSearching(FilmsPagination, FilmsRatingFilter):
     query: str | None = Field(
         default=None, description="Search films by query"
     )
+
+
+class FilmFacetsFilter(FilmsRatingFilter):
+    query: str | None = Field(
+        default=None, description="Search films by query"
+    )
+    genre: str | None = Field(
+        default=None, description="Filter films by genre name"
+    )
+
+
+class FilmsExportParams(BaseModel):
+    fields: list[str] | None = Field(
+        default=None, description="Film fields to export, all by default"
+    )
+    changed_since: datetime | None = Field(
+        default=None, description="Export only films changed since then"
+    )
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, fields: list[str] | None):
+        unknown = set(fields or []) - set(FilmExport.model_fields)
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+        return fields
@@ -7,10 +7,12 @@ class Person(BaseModel):
    class FilmEntity(BaseModel):
       id: str
       roles: list[str]
+      title: str | None = None
+      imdb_rating: float | None = None
    films: list[FilmEntity]
 
 class FilmsByPerson(BaseModel):
    id: str
-   title: str
-   imdb_rating: float
+   title: str | None
+   imdb_rating: float | None
    
\ No newline at end of file
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+from src.models.film import FilmPreview
+from src.models.filters import Pagination
+from src.models.genre import Genre
+from src.models.persons import Person
+
+
+class SearchResults(BaseModel):
+    """Результаты поиска по всем индексам, сгруппированные по типу"""
+
+    films: list[FilmPreview]
+    persons: list[Person]
+    genres: list[Genre]
+
+
+class SearchParams(Pagination):
+    query: str = Field(
+        min_length=1, max_length=200, description="Search query"
+    )
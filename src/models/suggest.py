@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class FilmSuggestion(BaseModel):
+    id: str
+    title: str
+
+
+class PersonSuggestion(BaseModel):
+    person_id: str
+    full_name: str
+
+
+class Suggestions(BaseModel):
+    """Подсказки для ввода: фильмы и персоны, совпавшие по префиксу"""
+
+    films: list[FilmSuggestion]
+    persons: list[PersonSuggestion]
+
+
+class SuggestParams(BaseModel):
+    query: str = Field(
+        min_length=1, max_length=100, description="Typed prefix"
+    )
+    size: int = Field(
+        default=5, ge=1, le=10, description="Suggestions of each kind"
+    )
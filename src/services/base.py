@@ -0,0 +1,256 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from src.core.config import settings
+from src.services.cache_entry import CacheEntry
+from src.services.cursor import NEXT_CURSOR_HEADER
+from src.services.elastic import (
+    ElasticService,
+    ElasticUnavailableError,
+    Page,
+)
+from src.services.redis import RedisService
+from src.services.single_flight import SingleFlight
+from src.services.utils import dump_response, get_cache_key, get_params_hash
+
+logger = logging.getLogger(__name__)
+
+
+class BaseService:
+    def __init__(
+        self, redis_service: RedisService, elastic_service: ElasticService
+    ):
+        self._redis_service = redis_service
+        self._elastic_service = elastic_service
+        self._single_flight = SingleFlight()
+        self._background_tasks: set[asyncio.Task] = set()
+        # cache keys of documents refreshed by a batch in the background
+        self._refreshing: set[str] = set()
+
+    def _list_key(self, name: str, *indexes: str, **kwargs) -> str:
+        # версии всех индексов в ключе: изменение любого из них
+        # делает закэшированный ответ недоступным
+        return get_cache_key(
+            name,
+            *(self._redis_service.namespace(index) for index in indexes),
+            get_params_hash(**kwargs),
+        )
+
+    async def _get_or_load(
+        self,
+        key: str,
+        from_elastic: Callable[[], Awaitable[Any]],
+        fallback: int | None = None,
+    ) -> CacheEntry | None:
+        """Return the cached response for the key.
+
+        On a miss the data is fetched from Elasticsearch, serialized once
+        and cached; concurrent misses for the same key are coalesced.
+        A stale entry is returned as is and refreshed in the background.
+        Not found results are cached too, as short-lived tombstones.
+        An expired entry is reloaded, but still served if Elasticsearch
+        is unavailable; it is kept for fallback seconds, by default
+        CACHE_LIST_FALLBACK_IN_SECONDS.
+        """
+        if fallback is None:
+            # list keys are left behind by every ETL load, see namespace()
+            fallback = settings.cache_list_fallback_in_seconds
+        entry = await self._redis_service.get(key)
+        if entry and not self._redis_service.is_expired(entry):
+            if entry.is_stale:
+                self._refresh_in_background(
+                    key, lambda: self._load(key, from_elastic, fallback)
+                )
+            return entry if entry.body else None
+        try:
+            return await self._single_flight.do(
+                key, lambda: self._load(key, from_elastic, fallback)
+            )
+        except ElasticUnavailableError:
+            if entry is None:
+                raise
+            logger.warning("Elasticsearch is unavailable, serving %s", key)
+            return entry if entry.body else None
+
+    async def _get_by_id(
+        self,
+        index: str,
+        id: str,
+        key: str,
+        from_elastic: Callable[[], Awaitable[Any]],
+    ) -> CacheEntry | None:
+        if not self._redis_service.might_exist(index, id):
+            return None
+        return await self._get_or_load(
+            key, from_elastic, settings.cache_fallback_in_seconds
+        )
+
+    async def _get_many_by_id(
+        self,
+        index: str,
+        name: str,
+        ids: list[str],
+        from_elastic: Callable[[list[str]], Awaitable[list]],
+    ) -> list[bytes | None]:
+        """Resolve many documents with one Redis MGET and one ES mget.
+
+        Documents missing in the cache are loaded with a single mget
+        and cached in one pipeline. Results keep the order of ids,
+        None marks a document that was not found.
+        """
+        known_ids = [
+            id
+            for id in dict.fromkeys(ids)
+            if self._redis_service.might_exist(index, id)
+        ]
+        keys = [get_cache_key(name, id) for id in known_ids]
+        entries = dict(
+            zip(known_ids, await self._redis_service.get_many(keys))
+        )
+        missing = [
+            id
+            for id, entry in entries.items()
+            if entry is None or self._redis_service.is_expired(entry)
+        ]
+        stale = [
+            id
+            for id, entry in entries.items()
+            if entry is not None
+            and entry.is_stale
+            and not self._redis_service.is_expired(entry)
+        ]
+        if stale:
+            self._refresh_many_in_background(name, stale, from_elastic)
+        bodies = {
+            id: entry.body
+            for id, entry in entries.items()
+            if entry is not None
+        }
+        if missing:
+            try:
+                bodies.update(
+                    await self._load_many(name, missing, from_elastic)
+                )
+            except ElasticUnavailableError:
+                # expired documents are still better than no answer
+                if any(entries[id] is None for id in missing):
+                    raise
+        return [bodies.get(id) or None for id in ids]
+
+    async def _load_many(
+        self,
+        name: str,
+        ids: list[str],
+        from_elastic: Callable[[list[str]], Awaitable[list]],
+    ) -> dict[str, bytes]:
+        documents = await from_elastic(ids)
+        # b"" is a tombstone for a document that was not found
+        loaded = {
+            id: dump_response(document) if document is not None else b""
+            for id, document in zip(ids, documents)
+        }
+        await self._redis_service.set_many(
+            {get_cache_key(name, id): body for id, body in loaded.items()}
+        )
+        return loaded
+
+    async def _load(
+        self,
+        key: str,
+        from_elastic: Callable[[], Awaitable[Any]],
+        fallback: int,
+    ) -> CacheEntry | None:
+        async with self._redis_service.lock(key) as locked:
+            if locked:
+                # another worker may have filled the cache while we waited
+                entry = await self._redis_service.get(key)
+                if entry and not entry.is_stale:
+                    return entry if entry.body else None
+            body, headers = self._serialize(await from_elastic())
+            entry = await self._redis_service.set(key, body, headers, fallback)
+            return entry if entry.body else None
+
+    async def _load_uncached(
+        self, from_elastic: Callable[[], Awaitable[Any]]
+    ) -> CacheEntry | None:
+        body, headers = self._serialize(await from_elastic())
+        if not body:
+            return None
+        return CacheEntry(body=body, fresh_until=0, headers=headers)
+
+    @staticmethod
+    def _serialize(data: Any) -> tuple[bytes, dict[str, str]]:
+        """Response body and headers for data loaded from Elasticsearch.
+
+        An empty body stands for a not found result.
+        """
+        headers = {}
+        if isinstance(data, Page):
+            if data.next_cursor:
+                headers[NEXT_CURSOR_HEADER] = data.next_cursor
+            data = data.items
+        return (dump_response(data) if data else b""), headers
+
+    def _refresh_in_background(
+        self, key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        if key in self._single_flight or key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, refresh))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _refresh_many_in_background(
+        self,
+        name: str,
+        ids: list[str],
+        from_elastic: Callable[[list[str]], Awaitable[list]],
+    ) -> None:
+        """Refresh stale documents not being refreshed already."""
+        keys = {get_cache_key(name, id): id for id in ids}
+        keys = {
+            key: id
+            for key, id in keys.items()
+            if key not in self._single_flight and key not in self._refreshing
+        }
+        if not keys:
+            return
+        self._refreshing.update(keys)
+        task = asyncio.create_task(
+            self._refresh_many(name, list(keys.values()), from_elastic)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(
+            lambda _: self._refreshing.difference_update(keys)
+        )
+
+    async def _refresh(
+        self, key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            await self._single_flight.do(key, refresh)
+        except ElasticUnavailableError:
+            logger.warning("Elasticsearch is unavailable, kept %s", key)
+        except Exception:
+            logger.exception("Failed to refresh cache key %s", key)
+
+    async def _refresh_many(
+        self,
+        name: str,
+        ids: list[str],
+        from_elastic: Callable[[list[str]], Awaitable[list]],
+    ) -> None:
+        try:
+            await self._load_many(name, ids, from_elastic)
+        except ElasticUnavailableError:
+            logger.warning(
+                "Elasticsearch is unavailable, kept %s %s documents",
+                len(ids),
+                name,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to refresh %s %s documents", len(ids), name
+            )
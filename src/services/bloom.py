@@ -0,0 +1,32 @@
+from hashlib import blake2b
+
+
+def get_bit_positions(item: str, size: int, hashes: int) -> list[int]:
+    """Bit positions of an item in a Bloom filter of the given size.
+
+    Must stay in sync with postgres_to_es/ETL/bloom.py, which builds
+    the filters.
+    """
+    digest = blake2b(item.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % size for i in range(hashes)]
+
+
+class BloomFilter:
+    """Read-only Bloom filter over a Redis bitmap."""
+
+    def __init__(self, bits: bytes, size: int, hashes: int) -> None:
+        self._bits = bits
+        self._size = size
+        self._hashes = hashes
+
+    def __contains__(self, item: str) -> bool:
+        for position in get_bit_positions(item, self._size, self._hashes):
+            byte = position >> 3
+            # Redis SETBIT numbers bits from the most significant one
+            if byte >= len(self._bits) or not (
+                self._bits[byte] & (0x80 >> (position & 7))
+            ):
+                return False
+        return True
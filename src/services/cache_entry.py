@@ -0,0 +1,45 @@
+import math
+import time
+from dataclasses import dataclass, field
+from hashlib import blake2b
+
+ETAG_HEADER = "ETag"
+
+
+def get_etag(data: bytes) -> str:
+    """Strong entity tag: a hash of the body or of an entity version."""
+    return f'"{blake2b(data, digest_size=16).hexdigest()}"'
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """Cached response body with a soft expiry.
+
+    After fresh_until the entry is stale: it is still served, but
+    should be refreshed. The hard expiry is the Redis key TTL.
+    An empty body is a tombstone for a document that was not found.
+    Large bodies keep their gzip and brotli variants, the ones stored
+    in Redis, to be sent to clients as is.
+    """
+
+    body: bytes
+    fresh_until: float
+    headers: dict[str, str] = field(default_factory=dict)
+    gzip_body: bytes | None = None
+    br_body: bytes | None = None
+
+    @property
+    def is_not_found(self) -> bool:
+        return not self.body
+
+    @property
+    def is_stale(self) -> bool:
+        return self.fresh_until < time.time()
+
+    @property
+    def etag(self) -> str:
+        # посчитан при записи в кэш, хэшируем тело только без него
+        return self.headers.get(ETAG_HEADER) or get_etag(self.body)
+
+
+EMPTY_LIST = CacheEntry(body=b"[]", fresh_until=math.inf)
@@ -0,0 +1,117 @@
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """The call was rejected without being made: the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calling a failing backend for a while.
+
+    After failure_threshold consecutive failures the circuit opens and
+    calls fail fast with CircuitOpenError. Once reset_timeout passes,
+    a single probe call is let through (half-open): its success closes
+    the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        is_failure: Callable[[Exception], bool],
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._is_failure = is_failure
+        self._state = CircuitState.closed
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.open
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            return CircuitState.half_open
+        return self._state
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds until the next probe call is allowed."""
+        elapsed = time.monotonic() - self._opened_at
+        return max(int(self._reset_timeout - elapsed), 1)
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        state = self.state
+        if state == CircuitState.open or (
+            state == CircuitState.half_open and self._probe_in_flight
+        ):
+            self.rejected += 1
+            raise CircuitOpenError(self.name)
+        probe = state == CircuitState.half_open
+        if probe:
+            self._probe_in_flight = True
+        self.calls += 1
+        try:
+            result = await func()
+        except Exception as exc:
+            if self._is_failure(exc):
+                self._on_failure(probe)
+            elif probe:
+                self._on_success(probe)
+            raise
+        else:
+            self._on_success(probe)
+            return result
+        finally:
+            if probe:
+                self._probe_in_flight = False
+
+    def _on_success(self, probe: bool) -> None:
+        # вызов, начатый до открытия цепи, не должен закрывать её
+        # в обход пробного запроса
+        if not probe and self._state != CircuitState.closed:
+            return
+        if self._state != CircuitState.closed:
+            logger.info("Circuit %s closed", self.name)
+        self._state = CircuitState.closed
+        self._failures = 0
+
+    def _on_failure(self, probe: bool) -> None:
+        self.failures += 1
+        self._failures += 1
+        if probe or self._failures >= self._failure_threshold:
+            if self._state != CircuitState.open or probe:
+                logger.warning("Circuit %s opened", self.name)
+                self.opened += 1
+            self._state = CircuitState.open
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "calls": self.calls,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
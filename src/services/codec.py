@@ -0,0 +1,101 @@
+import gzip
+import struct
+from functools import lru_cache
+
+import brotli
+from orjson import orjson
+
+from src.core.config import settings
+from src.services.cache_entry import CacheEntry
+
+FORMAT_VERSION = 3
+
+FLAG_GZIP = 0b0000_0001
+FLAG_BR = 0b0000_0010
+
+# format version, flags, fresh_until (unix time), size of the response
+# headers, size of the brotli variant; the headers (JSON), the brotli
+# variant and the payload follow
+_HEADER = struct.Struct(">BBdHI")
+
+
+class CacheCodec:
+    """Encodes cache entries into the binary format stored in Redis.
+
+    Bodies larger than min_size are compressed once, with gzip and
+    with brotli (if br_quality is set): the compressed variants are
+    kept in the entry and reused when the entry is encoded and when
+    it is sent to a client. Values written in another format version
+    are reported as a cache miss.
+    """
+
+    def __init__(
+        self, min_size: int, level: int, br_quality: int | None = None
+    ) -> None:
+        self._min_size = min_size
+        self._level = level
+        self._br_quality = br_quality
+
+    def compress(self, body: bytes) -> tuple[bytes | None, bytes | None]:
+        """The gzip and brotli variants of the body, if worth it."""
+        if len(body) < self._min_size:
+            return None, None
+        br_body = None
+        if self._br_quality is not None:
+            br_body = brotli.compress(body, quality=self._br_quality)
+        return gzip.compress(body, self._level, mtime=0), br_body
+
+    def encode(self, entry: CacheEntry) -> bytes:
+        flags = 0
+        payload = entry.body
+        gzip_body, br_body = entry.gzip_body, entry.br_body
+        if gzip_body is None:
+            gzip_body, br_body = self.compress(payload)
+        if gzip_body is not None:
+            flags |= FLAG_GZIP
+            payload = gzip_body
+        if br_body is not None:
+            flags |= FLAG_BR
+        else:
+            br_body = b""
+        headers = orjson.dumps(entry.headers) if entry.headers else b""
+        header = _HEADER.pack(
+            FORMAT_VERSION,
+            flags,
+            entry.fresh_until,
+            len(headers),
+            len(br_body),
+        )
+        return header + headers + br_body + payload
+
+    def decode(self, data: bytes) -> CacheEntry | None:
+        if len(data) < _HEADER.size or data[0] != FORMAT_VERSION:
+            return None
+        _, flags, fresh_until, headers_size, br_size = _HEADER.unpack_from(
+            data
+        )
+        headers_start = _HEADER.size
+        br_start = headers_start + headers_size
+        payload_start = br_start + br_size
+        headers = data[headers_start:br_start]
+        payload = data[payload_start:]
+        gzip_body = None
+        if flags & FLAG_GZIP:
+            gzip_body = payload
+            payload = gzip.decompress(payload)
+        return CacheEntry(
+            body=payload,
+            fresh_until=fresh_until,
+            headers=orjson.loads(headers) if headers else {},
+            gzip_body=gzip_body,
+            br_body=data[br_start:payload_start] if flags & FLAG_BR else None,
+        )
+
+
+@lru_cache()
+def get_cache_codec() -> CacheCodec:
+    return CacheCodec(
+        min_size=settings.cache_compress_min_size,
+        level=settings.cache_compress_level,
+        br_quality=settings.cache_brotli_quality,
+    )
@@ -0,0 +1,44 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+
+from orjson import orjson
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """The cursor can not continue the requested result set."""
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Position of the next page in a sorted result set.
+
+    after holds the sort values of the last hit of the previous page
+    (search_after), sort is the ES sort they belong to, pit is an
+    optional point-in-time id.
+    """
+
+    after: list
+    sort: list
+    pit: str | None = None
+
+    def encode(self) -> str:
+        data = {"after": self.after, "sort": self.sort, "pit": self.pit}
+        return urlsafe_b64encode(orjson.dumps(data)).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Parse an opaque cursor token, raise ValueError if invalid."""
+        try:
+            data = orjson.loads(
+                urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            )
+            cursor = cls(
+                after=data["after"], sort=data["sort"], pit=data["pit"]
+            )
+        except (ValueError, TypeError, KeyError) as exc:
+            raise InvalidCursorError("invalid cursor") from exc
+        if not isinstance(cursor.after, list) or not cursor.after:
+            raise InvalidCursorError("invalid cursor")
+        return cursor
@@ -1,53 +1,284 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
 from functools import lru_cache
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID
 
-from elasticsearch import AsyncElasticsearch, NotFoundError
+from elastic_transport import TransportError
+from elasticsearch import (
+    ApiError,
+    AsyncElasticsearch,
+    BadRequestError,
+    NotFoundError,
+)
 from fastapi import Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
 
 from src.core.config import settings
 from src.db.elastic import get_elastic
 from src.enums import FilmsSortOption
-from src.models.film import Film, FilmPreview
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.cursor import Cursor, InvalidCursorError
+from src.models.film import Film, FilmExport, FilmFacets, FilmPreview
 from src.models.genre import Genre
 from src.models.persons import Person
+from src.models.suggest import FilmSuggestion, PersonSuggestion
+
+# genres are a small set, all of them fit into one terms aggregation
+FACETS_GENRES_SIZE = 100
+FACETS_RATING_INTERVAL = 1
+
+# ES adds an implicit _shard_doc tiebreaker to sorts in a point-in-time;
+# id is unique already, so the value only has to skip the last hit
+SHARD_DOC_AFTER_LAST = 2**63 - 1
+
+
+@lru_cache()
+def get_source_fields(model: type[BaseModel]) -> list[str]:
+    """Paths of the source fields a model is built from.
+
+    List queries fetch only these fields instead of the whole document;
+    nested models are expanded, e.g. films.id, films.roles.
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        nested = [
+            arg
+            for arg in (field.annotation, *get_args(field.annotation))
+            if isinstance(arg, type) and issubclass(arg, BaseModel)
+        ]
+        if nested:
+            fields.extend(
+                f"{name}.{path}" for path in get_source_fields(nested[0])
+            )
+        else:
+            fields.append(name)
+    return fields
+
+
+def _lean_annotation(annotation: Any) -> Any:
+    """The annotation with nested models replaced by typed dicts."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return get_typed_dict(annotation)
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    args = tuple(_lean_annotation(arg) for arg in args)
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return Union[args]
+    return origin[args]
+
+
+@lru_cache()
+def get_typed_dict(model: type[BaseModel], partial: bool = False) -> type:
+    """TypedDict with the fields, types and defaults of a model.
+
+    In a partial one every field is optional and has no default,
+    for sources projected to some of the fields.
+    """
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = _lean_annotation(field.annotation)
+        if partial:
+            annotation = NotRequired[annotation]
+        elif not field.is_required():
+            annotation = NotRequired[
+                Annotated[annotation, Field(default=field.default)]
+            ]
+        fields[name] = annotation
+    return TypedDict(model.__name__, fields)
+
+
+@lru_cache()
+def get_source_adapter(
+    model: type[BaseModel], many: bool, partial: bool = False
+) -> TypeAdapter:
+    """Validator of ES sources against a model.
+
+    Sources are validated once, in pydantic-core, into plain dicts:
+    no model instance is built per hit and the dicts are dumped
+    to the response body as they are.
+    """
+    typed_dict = get_typed_dict(model, partial)
+    return TypeAdapter(list[typed_dict] if many else typed_dict)
+
+
+@dataclass(slots=True)
+class Page:
+    """One page of search results and the cursor of the next page."""
+
+    items: list
+    next_cursor: str | None = None
+
+
+class ElasticUnavailableError(Exception):
+    """Elasticsearch is down, too slow or the circuit breaker is open."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Elasticsearch is unavailable")
+        self.retry_after = retry_after
+
+
+class MultiSearchError(Exception):
+    """One of the searches of an _msearch request failed."""
+
+    def __init__(self, status: int, error: Any) -> None:
+        super().__init__(f"msearch failed with {status}: {error}")
+        self.status = status
+
+
+def check_msearch(docs: dict) -> None:
+    """Raise MultiSearchError for a failed or timed out search.
+
+    _msearch answers 200 even if some of its searches failed, the
+    errors come inside the responses. A missing index is left to
+    the caller, like NotFoundError of a single search.
+    """
+    for response in docs["responses"]:
+        if "error" in response:
+            status = response.get("status", 500)
+            if status != 404:
+                raise MultiSearchError(status, response["error"])
+        elif response.get("timed_out"):
+            raise MultiSearchError(504, "timed out")
+
+
+def is_elastic_failure(exc: Exception) -> bool:
+    """Errors that mean ES is unhealthy, not that the request is wrong."""
+    if isinstance(exc, (TransportError, asyncio.TimeoutError)):
+        return True
+    if isinstance(exc, MultiSearchError):
+        return exc.status >= 500
+    return isinstance(exc, ApiError) and exc.meta.status >= 500
 
 
 class ElasticService:
-    def __init__(self, elastic: AsyncElasticsearch):
+    def __init__(self, elastic: AsyncElasticsearch, breaker: CircuitBreaker):
         self._elastic = elastic
+        self._breaker = breaker
+
+    async def _request(
+        self,
+        method: str,
+        timeout: float,
+        check: Callable[[Any], None] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Call the ES client through the circuit breaker.
+
+        Every call has its own timeout instead of the client default,
+        so a slow cluster can not hold requests for long. check may
+        raise for a response that reports a failure in its body, the
+        breaker counts it like a failed call.
+        """
+        client = self._elastic.options(request_timeout=timeout)
+
+        async def call() -> Any:
+            response = await getattr(client, method)(**kwargs)
+            if check is not None:
+                check(response)
+            return response
+
+        try:
+            return await self._breaker.call(call)
+        except CircuitOpenError as exc:
+            raise ElasticUnavailableError(self._breaker.retry_after) from exc
+        except Exception as exc:
+            if is_elastic_failure(exc):
+                raise ElasticUnavailableError(
+                    self._breaker.retry_after
+                ) from exc
+            raise
 
     async def _get_index_data_by_id(
         self, index: str, id: UUID, model: BaseModel
     ):
         try:
-            doc = await self._elastic.get(index=index, id=id)
+            doc = await self._request(
+                "get",
+                index=index,
+                id=id,
+                timeout=settings.es_lookup_timeout_in_seconds,
+            )
         except NotFoundError:
             return None
-        return model(**doc["_source"])
+        return get_source_adapter(model, many=False).validate_python(
+            doc["_source"]
+        )
+
+    async def _get_index_data_by_ids(
+        self, index: str, ids: list[str], model: BaseModel
+    ):
+        try:
+            docs = await self._request(
+                "mget",
+                index=index,
+                ids=ids,
+                timeout=settings.es_lookup_timeout_in_seconds,
+            )
+        except NotFoundError:
+            return [None] * len(ids)
+        adapter = get_source_adapter(model, many=False)
+        return [
+            (
+                adapter.validate_python(doc["_source"])
+                if doc.get("found")
+                else None
+            )
+            for doc in docs["docs"]
+        ]
 
     def _parse_pagination(self, params: dict):
         page_size = params.get("page_size", 10)
+        if params.get("cursor"):
+            # the position is given by search_after
+            return 0, page_size
         page = params.get("page", 1)
         return (page - 1) * page_size, page_size
 
-    def _parse_sorting(self, params: dict):
+    def _parse_sorting(self, params: dict, key_field: str = "id"):
         sort = params.get("sort", None)
         match sort:
             case FilmsSortOption.asc:
-                sort_ = [{sort: "asc"}]
+                sort_ = [{FilmsSortOption.asc.value: "asc"}]
             case FilmsSortOption.desc:
                 sort_ = [{sort[1:]: "desc"}]
+            case _ if params.get("query"):
+                sort_ = ["_score"]
             case _:
-                sort_ = None
-        return sort_
+                # without a full-text query there is nothing to score
+                sort_ = []
+        # уникальный ключ делает порядок стабильным для search_after
+        return sort_ + [{key_field: "asc"}]
 
     def _parse_genre(self, params: dict):
         genre = params.get("genre", None)
         if genre:
-            genre = {"match": {"genres": genre}}
+            genre = {"term": {"genres": genre}}
         return genre
 
+    def _parse_rating(self, params: dict):
+        bounds = {
+            bound: params[name]
+            for name, bound in (("min_rating", "gte"), ("max_rating", "lte"))
+            if params.get(name) is not None
+        }
+        if bounds:
+            return {"range": {"imdb_rating": bounds}}
+        return None
+
     def _parse_query(self, params: dict, search_field: str = "title"):
         query = params.get("query", None)
         if query:
@@ -62,90 +293,455 @@ class ElasticService:
             }
         return query
 
-    def _get_es_query_param(self, *args):
-        not_none_args = []
-        for arg in args:
-            if arg:
-                not_none_args.append(arg)
-        if not not_none_args:
-            query = {"match_all": {}}
-        else:
-            query = {"bool": {"must": not_none_args}}
+    def _parse_suggest_query(self, query: str, search_field: str):
+        # search_as_you_type subfield: the last term is matched as a prefix
+        return {
+            "multi_match": {
+                "query": query,
+                "type": "bool_prefix",
+                "fields": [
+                    f"{search_field}.suggest",
+                    f"{search_field}.suggest._2gram",
+                    f"{search_field}.suggest._3gram",
+                ],
+            }
+        }
+
+    def _get_es_query_param(self, queries: list, filters: list):
+        """Bool query: scoring queries in must, exact filters in filter.
+
+        Filter clauses are not scored and ES caches their bitsets,
+        so repeated filtering by the same genre or rating is cheap.
+        """
+        queries = [query for query in queries if query]
+        filters = [filter_ for filter_ in filters if filter_]
+        if not queries and not filters:
+            return {"match_all": {}}
+        query = {"bool": {}}
+        if queries:
+            query["bool"]["must"] = queries
+        if filters:
+            query["bool"]["filter"] = filters
         return query
 
-    def _parse_query_params(self, params: dict, search_field: str = "title"):
+    def _parse_query_params(
+        self, params: dict, search_field: str = "title", key_field: str = "id"
+    ):
         parsed_params = dict()
         parsed_params["from_"], parsed_params["size"] = self._parse_pagination(
             params
         )
-        parsed_params["sort"] = self._parse_sorting(params)
+        parsed_params["sort"] = self._parse_sorting(params, key_field)
+        # listings never return totals; without counting, a sort that
+        # matches the index sort (MOVIES_INDEX_SORT_ENABLED in the ETL)
+        # stops after the first size documents of each segment
+        parsed_params["track_total_hits"] = False
 
-        genre = self._parse_genre(params)
         query = self._parse_query(params, search_field=search_field)
-        parsed_params["query"] = self._get_es_query_param(genre, query)
+        parsed_params["query"] = self._get_es_query_param(
+            [query], [self._parse_genre(params), self._parse_rating(params)]
+        )
         return parsed_params
 
+    def _get_msearch_body(
+        self, params: dict, search_field: str, key_field: str = "id"
+    ) -> dict:
+        body = self._parse_query_params(
+            params, search_field=search_field, key_field=key_field
+        )
+        body["from"] = body.pop("from_")
+        return body
+
     async def _get_index_data_by_query_params(
         self, index: str, model: BaseModel, **params
     ):
         try:
-            docs = await self._elastic.search(index=index, **params)
+            docs = await self._request(
+                "search",
+                index=index,
+                source_includes=get_source_fields(model),
+                timeout=settings.es_search_timeout_in_seconds,
+                **params,
+            )
         except NotFoundError:
             return None
 
-        return [model(**doc["_source"]) for doc in docs["hits"]["hits"]]
+        return get_source_adapter(model, many=True).validate_python(
+            [doc["_source"] for doc in docs["hits"]["hits"]]
+        )
+
+    async def _search_page(
+        self,
+        index: str,
+        model: BaseModel,
+        cursor: Cursor | None,
+        **params,
+    ) -> Page | None:
+        """Search one page, continuing after the cursor if given.
+
+        With CURSOR_PIT_ENABLED cursor pages are read from a point-in-time,
+        so deep paging sees one snapshot of the index. An expired
+        point-in-time falls back to a plain search_after over the index.
+        """
+        if cursor is not None:
+            if cursor.sort != params["sort"]:
+                # e.g. a cursor of a listing passed to a full-text search
+                raise InvalidCursorError(
+                    "cursor does not match the sort order"
+                )
+            # a point-in-time cursor also holds the _shard_doc tiebreaker
+            if len(cursor.after) - len(cursor.sort) not in (0, 1):
+                raise InvalidCursorError("invalid cursor")
+        params["source_includes"] = get_source_fields(model)
+        try:
+            docs, pit = await self._search_after_cursor(index, cursor, params)
+        except BadRequestError as exc:
+            if cursor is None:
+                raise
+            # ES rejects search_after values that do not fit the sort
+            raise InvalidCursorError("invalid cursor") from exc
+        if docs is None:
+            return None
+
+        hits = docs["hits"]["hits"]
+        next_cursor = None
+        if hits and len(hits) == params["size"]:
+            next_cursor = Cursor(
+                after=hits[-1]["sort"],
+                sort=params["sort"],
+                pit=docs.get("pit_id") if pit else None,
+            )
+        return Page(
+            items=get_source_adapter(model, many=True).validate_python(
+                [doc["_source"] for doc in hits]
+            ),
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
 
-    async def get_film_from_elastic(self, film_id: str) -> Film | None:
+    async def _search_after_cursor(
+        self, index: str, cursor: Cursor | None, params: dict
+    ) -> tuple[dict | None, str | None]:
+        """Search response and the point-in-time it was read from."""
+        after = None
+        if cursor is not None:
+            after = cursor.after[: len(params["sort"])]
+            params["search_after"] = after
+        pit = None
+        try:
+            if cursor is not None and settings.cursor_pit_enabled:
+                if cursor.pit:
+                    pit = cursor.pit
+                    params["search_after"] = cursor.after
+                else:
+                    pit = await self._open_point_in_time(index)
+                    params["search_after"] = [*after, SHARD_DOC_AFTER_LAST]
+            return await self._search(index, pit, **params), pit
+        except NotFoundError:
+            if pit is None:
+                return None, None
+            params["search_after"] = after
+            try:
+                return await self._search(index, None, **params), None
+            except NotFoundError:
+                return None, None
+
+    async def _open_point_in_time(self, index: str) -> str:
+        pit = await self._request(
+            "open_point_in_time",
+            index=index,
+            keep_alive=settings.cursor_pit_keep_alive,
+            timeout=settings.es_lookup_timeout_in_seconds,
+        )
+        return pit["id"]
+
+    async def _close_point_in_time(self, pit: str) -> None:
+        try:
+            await self._request(
+                "close_point_in_time",
+                id=pit,
+                timeout=settings.es_lookup_timeout_in_seconds,
+            )
+        except Exception:
+            # an unclosed point-in-time expires after its keep alive
+            pass
+
+    async def _search(self, index: str, pit: str | None, **params):
+        if pit is None:
+            return await self._request(
+                "search",
+                index=index,
+                timeout=settings.es_search_timeout_in_seconds,
+                **params,
+            )
+        return await self._request(
+            "search",
+            pit={"id": pit, "keep_alive": settings.cursor_pit_keep_alive},
+            timeout=settings.es_search_timeout_in_seconds,
+            **params,
+        )
+
+    async def _msearch(
+        self, searches: list[tuple[str, BaseModel, dict]], **common
+    ) -> list[list]:
+        """Run searches over several indexes in one _msearch round trip.
+
+        Each search is (index, model, body); common params are added
+        to every body. A search over a missing index yields an empty
+        list, other failed searches fail the whole request.
+        """
+        body = []
+        for index, model, params in searches:
+            body.append({"index": index})
+            body.append(
+                {
+                    **common,
+                    **params,
+                    "_source": get_source_fields(model),
+                }
+            )
+        docs = await self._request(
+            "msearch",
+            searches=body,
+            timeout=settings.es_search_timeout_in_seconds,
+            check=check_msearch,
+        )
+        return [
+            get_source_adapter(model, many=True).validate_python(
+                [
+                    doc["_source"]
+                    for doc in response.get("hits", {}).get("hits", [])
+                ]
+            )
+            for (_, model, _), response in zip(searches, docs["responses"])
+        ]
+
+    async def get_film_from_elastic(self, film_id: str) -> dict | None:
         return await self._get_index_data_by_id(
             settings.movies_index_name, film_id, Film
         )
 
-    async def get_genre_from_elastic(self, genre_id) -> Genre | None:
+    async def get_genre_from_elastic(self, genre_id) -> dict | None:
         return await self._get_index_data_by_id(
             settings.genres_index_name, genre_id, Genre
         )
 
-    async def get_person_from_elastic(self, person_id) -> Person | None:
+    async def get_person_from_elastic(self, person_id) -> dict | None:
         return await self._get_index_data_by_id(
             settings.persons_index_name, person_id, Person
         )
 
-    async def get_films_from_elastic(
-        self, **kwargs
-    ) -> list[FilmPreview] | None:
+    async def get_films_from_elastic(self, **kwargs) -> Page | None:
         params = self._parse_query_params(kwargs)
-        return await self._get_index_data_by_query_params(
-            settings.movies_index_name, FilmPreview, **params
+        cursor = kwargs.get("cursor")
+        return await self._search_page(
+            settings.movies_index_name,
+            FilmPreview,
+            Cursor.decode(cursor) if cursor else None,
+            **params,
         )
 
-    async def get_genres_from_elastic(self, **kwargs) -> list[Genre] | None:
+    async def export_films_from_elastic(
+        self, fields: list[str] | None, changed_since: datetime | None
+    ) -> AsyncIterator[list[dict]]:
+        """Walk the whole movies index in batches of films.
+
+        Batches are read from a point-in-time in index order, each one
+        after the last hit of the previous: the export sees a single
+        snapshot of the index and a batch costs the same at any depth.
+        """
+        fields = set(fields or FilmExport.model_fields)
+        params = {
+            "query": self._get_es_query_param(
+                [],
+                [
+                    (
+                        {
+                            "range": {
+                                "modified": {"gte": changed_since.isoformat()}
+                            }
+                        }
+                        if changed_since
+                        else None
+                    )
+                ],
+            ),
+            "size": settings.films_export_batch_size,
+            "sort": [{"_shard_doc": "asc"}],
+            "track_total_hits": False,
+            "source_includes": [
+                path
+                for path in get_source_fields(FilmExport)
+                if path.split(".")[0] in fields
+            ],
+        }
+        adapter = get_source_adapter(FilmExport, many=True, partial=True)
+        try:
+            pit = await self._open_point_in_time(settings.movies_index_name)
+        except NotFoundError:
+            return
+        try:
+            while True:
+                docs = await self._search(
+                    settings.movies_index_name, pit, **params
+                )
+                pit = docs.get("pit_id", pit)
+                hits = docs["hits"]["hits"]
+                if hits:
+                    yield adapter.validate_python(
+                        [doc["_source"] for doc in hits]
+                    )
+                if len(hits) < params["size"]:
+                    return
+                params["search_after"] = hits[-1]["sort"]
+        finally:
+            await self._close_point_in_time(pit)
+
+    async def get_film_facets_from_elastic(self, **kwargs) -> FilmFacets:
+        query = self._get_es_query_param(
+            [self._parse_query(kwargs)],
+            [self._parse_genre(kwargs), self._parse_rating(kwargs)],
+        )
+        try:
+            # only aggregations are computed, no hits are fetched
+            docs = await self._request(
+                "search",
+                index=settings.movies_index_name,
+                timeout=settings.es_search_timeout_in_seconds,
+                query=query,
+                size=0,
+                track_total_hits=True,
+                aggs={
+                    "genres": {
+                        "terms": {
+                            "field": "genres",
+                            "size": FACETS_GENRES_SIZE,
+                        }
+                    },
+                    "ratings": {
+                        "histogram": {
+                            "field": "imdb_rating",
+                            "interval": FACETS_RATING_INTERVAL,
+                            "min_doc_count": 0,
+                            "extended_bounds": {"min": 0, "max": 10},
+                        }
+                    },
+                },
+            )
+        except NotFoundError:
+            return FilmFacets(total=0, genres=[], ratings=[])
+        aggregations = docs["aggregations"]
+        return FilmFacets(
+            total=docs["hits"]["total"]["value"],
+            genres=[
+                {"genre": bucket["key"], "count": bucket["doc_count"]}
+                for bucket in aggregations["genres"]["buckets"]
+            ],
+            ratings=[
+                {"rating": bucket["key"], "count": bucket["doc_count"]}
+                for bucket in aggregations["ratings"]["buckets"]
+            ],
+        )
+
+    async def get_genres_from_elastic(self, **kwargs) -> list[dict] | None:
         params = self._parse_query_params(kwargs)
         return await self._get_index_data_by_query_params(
             settings.genres_index_name, Genre, **params
         )
 
-    async def get_persons_from_elastic(self, **kwargs) -> list[Person] | None:
-        params = self._parse_query_params(kwargs, search_field="full_name")
+    async def get_all_genres_from_elastic(self) -> list[dict] | None:
+        return await self._get_index_data_by_query_params(
+            settings.genres_index_name,
+            Genre,
+            query={"match_all": {}},
+            size=settings.genres_snapshot_max_size,
+            sort=self._parse_sorting({}),
+        )
+
+    async def get_persons_from_elastic(self, **kwargs) -> list[dict] | None:
+        params = self._parse_query_params(
+            kwargs, search_field="full_name", key_field="person_id"
+        )
         return await self._get_index_data_by_query_params(
             settings.persons_index_name, Person, **params
         )
 
-    async def get_films_by_person_from_elastic(self, person_id: str):
-        films_by_person = []
-        person_data = await self.get_person_from_elastic(person_id)
-        if not person_data:
-            return None
-        films_id = [film["id"] for film in person_data.model_dump()["films"]]
-        if not films_id:
-            return None
-        for id in films_id:
-            film = await self.get_film_from_elastic(id)
-            films_by_person.append(FilmPreview(**film.model_dump()))
-        return films_by_person
+    async def get_films_by_ids_from_elastic(
+        self, films_ids: list[str]
+    ) -> list[dict | None]:
+        return await self._get_index_data_by_ids(
+            settings.movies_index_name, films_ids, Film
+        )
+
+    async def get_genres_by_ids_from_elastic(
+        self, genres_ids: list[str]
+    ) -> list[dict | None]:
+        return await self._get_index_data_by_ids(
+            settings.genres_index_name, genres_ids, Genre
+        )
+
+    async def get_persons_by_ids_from_elastic(
+        self, persons_ids: list[str]
+    ) -> list[dict | None]:
+        return await self._get_index_data_by_ids(
+            settings.persons_index_name, persons_ids, Person
+        )
+
+    async def get_suggestions_from_elastic(
+        self, query: str, size: int
+    ) -> dict:
+        films, persons = await self._msearch(
+            [
+                (
+                    settings.movies_index_name,
+                    FilmSuggestion,
+                    {"query": self._parse_suggest_query(query, "title")},
+                ),
+                (
+                    settings.persons_index_name,
+                    PersonSuggestion,
+                    {"query": self._parse_suggest_query(query, "full_name")},
+                ),
+            ],
+            size=size,
+        )
+        return {"films": films, "persons": persons}
+
+    async def get_search_results_from_elastic(self, **kwargs) -> dict:
+        films, persons, genres = await self._msearch(
+            [
+                (
+                    settings.movies_index_name,
+                    FilmPreview,
+                    self._get_msearch_body(kwargs, "title"),
+                ),
+                (
+                    settings.persons_index_name,
+                    Person,
+                    self._get_msearch_body(kwargs, "full_name", "person_id"),
+                ),
+                (
+                    settings.genres_index_name,
+                    Genre,
+                    self._get_msearch_body(kwargs, "name"),
+                ),
+            ]
+        )
+        return {"films": films, "persons": persons, "genres": genres}
+
+
+@lru_cache()
+def get_elastic_circuit_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "elasticsearch",
+        failure_threshold=settings.es_breaker_failure_threshold,
+        reset_timeout=settings.es_breaker_reset_timeout_in_seconds,
+        is_failure=is_elastic_failure,
+    )
 
 
 @lru_cache()
 def get_elastic_service(
     elastic: AsyncElasticsearch = Depends(get_elastic),
+    breaker: CircuitBreaker = Depends(get_elastic_circuit_breaker),
 ) -> ElasticService:
-    return ElasticService(elastic)
+    return ElasticService(elastic, breaker)
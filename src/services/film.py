@@ -1,34 +1,80 @@
 from functools import lru_cache
+from typing import AsyncIterator
 from fastapi import Depends
-from src.models.film import Film, FilmPreview
+from orjson import orjson
+from src.core.config import settings
+from src.services.base import BaseService
+from src.services.cache_entry import EMPTY_LIST, CacheEntry
 from src.services.elastic import ElasticService, get_elastic_service
 from src.services.redis import RedisService, get_redis_service
+from src.services.utils import get_cache_key
 
 
-class FilmService:
-    def __init__(self, redis_service: RedisService, elastic_service: ElasticService):
-        self._redis_service = redis_service
-        self._elastic_service = elastic_service
-    
-    async def all(self, **kwargs) -> list[FilmPreview]:
-        films = await self._redis_service._films_from_cache(**kwargs)
-        if not films:
-            films = await self._elastic_service.get_films_from_elastic(
-                **kwargs
+class FilmService(BaseService):
+    async def all(self, **kwargs) -> CacheEntry:
+        def from_elastic():
+            return self._elastic_service.get_films_from_elastic(**kwargs)
+
+        if kwargs.get("cursor") and settings.cursor_pit_enabled:
+            # point-in-time pages belong to a single client, so they are
+            # not cached
+            films = await self._load_uncached(from_elastic)
+        else:
+            films = await self._get_or_load(
+                self._list_key("films", settings.movies_index_name, **kwargs),
+                from_elastic,
             )
-            if not films:
-                return []
-            await  self._redis_service._put_films_to_cache(films, **kwargs)
-        return films
-
-    async def get_by_id(self, film_id: str) -> Film | None:
-        film = await self._redis_service._film_from_cache(film_id)
-        if not film:
-            film = await self._elastic_service.get_film_from_elastic(film_id)
-            if not film:
-                return None
-            await  self._redis_service._put_film_to_cache(film)
-        return film
+        return films or EMPTY_LIST
+
+    async def facets(self, **kwargs) -> CacheEntry:
+        return await self._get_or_load(
+            self._list_key(
+                "film_facets", settings.movies_index_name, **kwargs
+            ),
+            lambda: self._elastic_service.get_film_facets_from_elastic(
+                **kwargs
+            ),
+        )
+
+    async def export(self, **kwargs) -> AsyncIterator[bytes]:
+        """The film catalogue as NDJSON chunks, one per batch from ES.
+
+        Exports bypass the cache and hold one batch in memory at a time.
+        The first batch is read before returning, so an unavailable
+        Elasticsearch fails the request before the response starts.
+        """
+        batches = self._elastic_service.export_films_from_elastic(**kwargs)
+        first = await anext(batches, None)
+
+        async def chunks():
+            try:
+                batch = first
+                while batch is not None:
+                    yield b"".join(
+                        orjson.dumps(film, option=orjson.OPT_APPEND_NEWLINE)
+                        for film in batch
+                    )
+                    batch = await anext(batches, None)
+            finally:
+                await batches.aclose()
+
+        return chunks()
+
+    async def get_by_id(self, film_id: str) -> CacheEntry | None:
+        return await self._get_by_id(
+            settings.movies_index_name,
+            film_id,
+            get_cache_key("film", film_id),
+            lambda: self._elastic_service.get_film_from_elastic(film_id),
+        )
+
+    async def get_many_by_id(self, films_ids: list[str]) -> list[bytes | None]:
+        return await self._get_many_by_id(
+            settings.movies_index_name,
+            "film",
+            films_ids,
+            self._elastic_service.get_films_by_ids_from_elastic,
+        )
 
 @lru_cache()
 def get_film_service(
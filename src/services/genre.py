@@ -1,38 +1,144 @@
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
 from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 from fastapi import Depends
-from src.models.genre import Genre
+from orjson import orjson
+
+from src.core.config import settings
+from src.services.base import BaseService
+from src.services.cache_entry import (
+    EMPTY_LIST,
+    ETAG_HEADER,
+    CacheEntry,
+    get_etag,
+)
 from src.services.elastic import ElasticService, get_elastic_service
 from src.services.redis import RedisService, get_redis_service
+from src.services.utils import get_cache_key
 
+logger = logging.getLogger(__name__)
 
-class GenreService:
-    def __init__(self, redis_service: RedisService, elastic_service: ElasticService):
-        self._redis_service = redis_service
-        self._elastic_service = elastic_service
 
-    async def all(self, **kwargs) -> list[Genre]:
-        genres = await self._redis_service._genres_from_cache(**kwargs)
-        if not genres:
-            genres = await self._elastic_service.get_genres_from_elastic(
-                **kwargs
-            )
-            if not genres:
-                return []
-            await self._redis_service._put_genres_to_cache(genres, **kwargs)
-        return genres
-
-    async def get_by_id(self, genre_id: str) -> Genre | None:
-        genre = await self._redis_service._genre_from_cache(genre_id)
-        if not genre:
-            genre = await self._elastic_service.get_genre_from_elastic(
-                genre_id
+@dataclass(frozen=True, slots=True)
+class GenreSnapshot:
+    """Immutable in-process copy of the whole genre catalogue.
+
+    Genres are kept serialized, in the order of the genres listing,
+    with an index by id. A refresh replaces the snapshot as a whole,
+    so readers never see a partly updated catalogue. The ETags of
+    pages are derived from the version of the whole catalogue.
+    """
+
+    bodies: tuple[bytes, ...]
+    by_id: Mapping[str, CacheEntry]
+    version: str
+
+    @classmethod
+    def from_genres(cls, genres: list[dict]) -> "GenreSnapshot":
+        bodies = tuple(orjson.dumps(genre) for genre in genres)
+        by_id = {
+            genre["id"]: CacheEntry(
+                body=body,
+                fresh_until=math.inf,
+                headers={ETAG_HEADER: get_etag(body)},
             )
-            if not genre:
-                return None
-            await self._redis_service._put_genre_to_cache(genre)
+            for genre, body in zip(genres, bodies)
+        }
+        return cls(
+            bodies=bodies,
+            by_id=MappingProxyType(by_id),
+            version=get_etag(b"[" + b",".join(bodies) + b"]"),
+        )
+
+    def page(self, page: int, page_size: int) -> CacheEntry | None:
+        start = (page - 1) * page_size
+        bodies = self.bodies[start:start + page_size]
+        if not bodies:
+            return None
+        return CacheEntry(
+            body=b"[" + b",".join(bodies) + b"]",
+            fresh_until=math.inf,
+            headers={
+                ETAG_HEADER: get_etag(
+                    f"{self.version}:{page}:{page_size}".encode()
+                )
+            },
+        )
+
+
+class GenreService(BaseService):
+    def __init__(
+        self, redis_service: RedisService, elastic_service: ElasticService
+    ):
+        super().__init__(redis_service, elastic_service)
+        self._snapshot: GenreSnapshot | None = None
+
+    async def all(self, **kwargs) -> CacheEntry:
+        if self._snapshot is not None:
+            entry = self._snapshot.page(kwargs["page"], kwargs["page_size"])
+            return entry or EMPTY_LIST
+        genres = await self._get_or_load(
+            self._list_key("genres", settings.genres_index_name, **kwargs),
+            lambda: self._elastic_service.get_genres_from_elastic(**kwargs),
+        )
+        return genres or EMPTY_LIST
+
+    async def get_by_id(self, genre_id: str) -> CacheEntry | None:
+        if self._snapshot is not None:
+            return self._snapshot.by_id.get(genre_id)
+        return await self._get_by_id(
+            settings.genres_index_name,
+            genre_id,
+            get_cache_key("genre", genre_id),
+            lambda: self._elastic_service.get_genre_from_elastic(genre_id),
+        )
+
+    async def get_many_by_id(
+        self, genres_ids: list[str]
+    ) -> list[bytes | None]:
+        if self._snapshot is not None:
+            entries = [self._snapshot.by_id.get(id) for id in genres_ids]
+            return [entry.body if entry else None for entry in entries]
+        return await self._get_many_by_id(
+            settings.genres_index_name,
+            "genre",
+            genres_ids,
+            self._elastic_service.get_genres_by_ids_from_elastic,
+        )
+
+    async def refresh(self) -> None:
+        """Reload the genre snapshot from Elasticsearch.
 
-        return genre
+        Until the first successful load, and while the genres index
+        is missing, genres are served through the cache, as any other
+        documents.
+        """
+        try:
+            genres = await self._elastic_service.get_all_genres_from_elastic()
+        except Exception:
+            logger.exception("Failed to refresh genres snapshot")
+            return
+        if genres is None:
+            # без индекса жанров снимок не строится, запросы идут через кэш
+            logger.warning("Genres index not found, snapshot is not used")
+            self._snapshot = None
+            return
+        if len(genres) >= settings.genres_snapshot_max_size:
+            logger.warning("Too many genres to keep them in memory")
+            self._snapshot = None
+            return
+        self._snapshot = GenreSnapshot.from_genres(genres)
+        logger.info("Genres snapshot refreshed: %s genres", len(genres))
 
+    async def refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(settings.genres_refresh_interval_in_seconds)
+            await self.refresh()
 
 
 @lru_cache()
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from orjson import orjson
+
+from src.core.config import settings
+from src.services.redis import RedisService
+from src.services.utils import get_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def get_affected_keys(index: str, ids: list[str]) -> list[str]:
+    """Cache keys of single documents that depend on the given ids."""
+    if index == settings.movies_index_name:
+        names = ["film"]
+    elif index == settings.genres_index_name:
+        names = ["genre"]
+    elif index == settings.persons_index_name:
+        names = ["person"]
+    else:
+        return []
+    return [get_cache_key(name, id) for id in ids for name in names]
+
+
+class CacheInvalidationListener:
+    """Consumes change events published by the ETL after each load.
+
+    Every worker evicts the affected keys from Redis and its own local
+    cache, switches list keys of the index to the new namespace version
+    and reloads the filter of known ids.
+    """
+
+    def __init__(self, redis_service: RedisService) -> None:
+        self._redis_service = redis_service
+        self._handlers: list[Callable[[dict], Awaitable[None]]] = []
+        # set once versions and filters are loaded after subscribing
+        self.ready = asyncio.Event()
+
+    def add_handler(self, handler: Callable[[dict], Awaitable[None]]) -> None:
+        """Register a callback run after the cache of an event is evicted."""
+        self._handlers.append(handler)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation listener failed")
+                await asyncio.sleep(1)
+
+    async def _listen(self) -> None:
+        pubsub = self._redis_service.redis.pubsub(
+            ignore_subscribe_messages=True
+        )
+        try:
+            await pubsub.subscribe(settings.cache_invalidation_channel)
+            # events published before the subscription would be lost
+            await self._redis_service.load_versions()
+            for index in self._redis_service.versions:
+                await self._redis_service.load_bloom_filter(index)
+            self.ready.set()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    await self.handle(orjson.loads(message["data"]))
+        finally:
+            await pubsub.aclose()
+
+    async def handle(self, event: dict) -> None:
+        index = event["index"]
+        versions = self._redis_service.versions
+        versions[index] = max(versions.get(index, 0), event["version"])
+        keys = get_affected_keys(index, event["ids"])
+        if keys:
+            await self._redis_service.delete(*keys)
+        await self._redis_service.load_bloom_filter(index)
+        for handler in self._handlers:
+            await handler(event)
+        logger.info(
+            "Invalidated %s cache: %s documents, version %s",
+            index,
+            len(event["ids"]),
+            versions[index],
+        )
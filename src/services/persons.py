@@ -1,54 +1,95 @@
 from functools import lru_cache
 from fastapi import Depends
-from src.models.film import FilmPreview
-from src.models.persons import Person
+from src.core.config import settings
+from orjson import orjson
+from src.enums import FilmsSortOption
+from src.services.base import BaseService
+from src.services.cache_entry import (
+    EMPTY_LIST,
+    ETAG_HEADER,
+    CacheEntry,
+    get_etag,
+)
 from src.services.elastic import ElasticService, get_elastic_service
 from src.services.redis import RedisService, get_redis_service
+from src.services.utils import get_cache_key
 
+FILMOGRAPHY_FIELDS = ("id", "title", "imdb_rating")
 
-class PersonService:
-    def __init__(self, redis_service: RedisService, elastic_service: ElasticService):
-        self._redis_service = redis_service
-        self._elastic_service = elastic_service
 
-    async def all(self, **kwargs) -> list[Person]:
-        persons = await self._redis_service._persons_from_cache(**kwargs)
-        if not persons:
-            persons = await self._elastic_service.get_persons_from_elastic(
-                **kwargs
-            )
-            if not persons:
-                return []
-            await self._redis_service._put_persons_to_cache(persons, **kwargs)
-        return persons
+class PersonService(BaseService):
+    async def all(self, **kwargs) -> CacheEntry:
+        persons = await self._get_or_load(
+            self._list_key("persons", settings.persons_index_name, **kwargs),
+            lambda: self._elastic_service.get_persons_from_elastic(**kwargs),
+        )
+        return persons or EMPTY_LIST
 
-    async def get_by_id(self, person_id: str) -> Person | None:
-        person = await self._redis_service._person_from_cache(person_id)
-        if not person:
-            person = await self._elastic_service.get_person_from_elastic(
-                person_id
-            )
-            if not person:
-                return None
-            await self._redis_service._put_person_to_cache(person)
-        return person
+    async def get_by_id(self, person_id: str) -> CacheEntry | None:
+        return await self._get_by_id(
+            settings.persons_index_name,
+            person_id,
+            get_cache_key("person", person_id),
+            lambda: self._elastic_service.get_person_from_elastic(person_id),
+        )
+
+    async def get_many_by_id(
+        self, persons_ids: list[str]
+    ) -> list[bytes | None]:
+        return await self._get_many_by_id(
+            settings.persons_index_name,
+            "person",
+            persons_ids,
+            self._elastic_service.get_persons_by_ids_from_elastic,
+        )
 
     async def get_films_by_person(
-        self, person_id: str
-    ) -> list[FilmPreview] | None:
-        films = await self._redis_service._films_by_person_from_cache(person_id)
+        self,
+        person_id: str,
+        sort: FilmsSortOption | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> CacheEntry | None:
+        """Filmography of a person, built from the cached person document.
+
+        The ETL writes film titles and ratings into the person document,
+        so no film is fetched: the films are only sorted and paginated.
+        Without page_size all films are returned.
+        """
+        person = await self.get_by_id(person_id)
+        if not person:
+            return None
+        films = orjson.loads(person.body)["films"]
         if not films:
-            films = (
-                await self._elastic_service.get_films_by_person_from_elastic(
-                    person_id
-                )
+            return None
+        if sort:
+            rated = [film for film in films if film["imdb_rating"] is not None]
+            rated.sort(
+                key=lambda film: film["imdb_rating"],
+                reverse=sort == FilmsSortOption.desc,
             )
-            if not films:
-                return None
-            await self._redis_service._put_films_by_person_to_cache(
-                person_id=person_id, films=films
-            )
-        return films
+            # фильмы без рейтинга всегда в конце
+            films = rated + [
+                film for film in films if film["imdb_rating"] is None
+            ]
+        if page_size is not None:
+            start = (page - 1) * page_size
+            films = films[start:start + page_size]
+        return CacheEntry(
+            body=orjson.dumps(
+                [
+                    {field: film[field] for field in FILMOGRAPHY_FIELDS}
+                    for film in films
+                ]
+            ),
+            fresh_until=person.fresh_until,
+            # the page changes only with the person document
+            headers={
+                ETAG_HEADER: get_etag(
+                    f"{person.etag}:{sort}:{page}:{page_size}".encode()
+                )
+            },
+        )
 
 
 @lru_cache()
@@ -1,132 +1,212 @@
+import time
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Annotated, Any
+from typing import Annotated, AsyncIterator
 from src.db.redis import get_redis
 from redis.asyncio import Redis
+from redis.exceptions import LockError
 from fastapi import Depends
-from src.models.film import Film, FilmPreview
-from src.models.genre import Genre
-from src.models.persons import Person
-from src.services.elastic import ElasticService, get_elastic_service
-from src.services.utils import get_key_by_args
+from src.services.bloom import BloomFilter
+from src.services.cache_entry import ETAG_HEADER, CacheEntry, get_etag
+from src.services.codec import CacheCodec, get_cache_codec
+from src.services.local_cache import LocalCache, get_local_cache
 from src.core.config import settings
-from orjson import orjson
 
 
 class RedisService:
-    def __init__(self, redis: Annotated[Redis, Depends(get_redis)]) -> None:
+    def __init__(
+        self,
+        redis: Annotated[Redis, Depends(get_redis)],
+        local_cache: Annotated[LocalCache, Depends(get_local_cache)],
+        codec: Annotated[CacheCodec, Depends(get_cache_codec)],
+    ) -> None:
         self.redis = redis
-
-    async def _films_by_person_from_cache(
-        self, *args, **kwargs
-    ) -> list[FilmPreview] | None:
-        key = f"films_by_person: {args[0]}"
-        data = await self.redis.get(key)
-        if not data:
-            return None
-        return [FilmPreview.parse_raw(item) for item in orjson.loads(data)]
-
-    async def _film_from_cache(self, film_id: str) -> Film | None:
-        key = f"film: {film_id}"
-        data = await self.redis.get(key)
-        if not data:
-            return None
-        film = Film.parse_raw(data)
-        return film
-
-    async def _films_from_cache(self, **kwargs) -> list[FilmPreview] | None:
-        key = f"films: {await get_key_by_args(**kwargs)}"
-        data = await self.redis.get(key)
-        if not data:
-            return None
-
-        return [FilmPreview.parse_raw(item) for item in orjson.loads(data)]
-
-    async def _put_film_to_cache(self, film: Film):
-        key = f"film: {film.id}"
-        await self.redis.set(
-            key, film.json(), settings.cache_expire_in_seconds
+        self.local_cache = local_cache
+        self.codec = codec
+        # версии пространств ключей списков по индексам, см. namespace()
+        self.versions: dict[str, int] = {}
+        self.bloom_filters: dict[str, BloomFilter] = {}
+
+    async def load_versions(self) -> None:
+        indexes = [
+            settings.movies_index_name,
+            settings.genres_index_name,
+            settings.persons_index_name,
+        ]
+        versions = await self.redis.mget(
+            [f"cache_version: {index}" for index in indexes]
         )
-
-    async def _put_films_to_cache(self, films: list[FilmPreview], **kwargs):
-        key = f"films: {await get_key_by_args(**kwargs)}"
-        await self.redis.set(
-            key,
-            orjson.dumps([film.json() for film in films]),
-            settings.cache_expire_in_seconds,
+        for index, version in zip(indexes, versions):
+            self.versions[index] = int(version or 0)
+
+    def namespace(self, index: str) -> str:
+        """Prefix for list keys of the index.
+
+        The ETL bumps the version after every load, which makes all list
+        keys of the index unreachable at once.
+        """
+        return f"{index}:v{self.versions.get(index, 0)}"
+
+    async def load_bloom_filter(self, index: str) -> None:
+        """Load the filter of known ids of the index built by the ETL.
+
+        The filter is used only after the ETL has put every document of
+        the index into it.
+        """
+        if not settings.bloom_filter_enabled:
+            return
+        complete, bits = await self.redis.mget(
+            [f"bloom: {index}: complete", f"bloom: {index}"]
         )
-        
-    async def _genre_from_cache(self, genre_id: str) -> Genre | None:
-            key = f"genre: {genre_id}"
-            data = await self.redis.get(key)
-            if not data:
-                return None
-            genre = Genre.model_validate_json(data)
-            return genre
-
-    async def _put_genre_to_cache(self, genre: Genre):
-        key = f"genre: {genre.id}"
-        await self.redis.set(
-            key, genre.model_dump_json(), settings.cache_expire_in_seconds
+        if not complete or bits is None:
+            # например, Redis очищен: добавленных после этого id нет в
+            # загруженном ранее фильтре, пользоваться им больше нельзя
+            self.bloom_filters.pop(index, None)
+            return
+        self.bloom_filters[index] = BloomFilter(
+            bits, settings.bloom_filter_size, settings.bloom_filter_hashes
         )
 
-    async def _genres_from_cache(self, **kwargs) -> list[Genre] | None:
-        key = f"genres: {await get_key_by_args(**kwargs)}"
-        data = await self.redis.get(key)
-        if not data:
-            return None
-        return [Genre.model_validate_json(item) for item in orjson.loads(data)]
-
-    async def _put_genres_to_cache(self, genres: list[Genre], **kwargs):
-        key = f"genres: {await get_key_by_args(**kwargs)}"
-        await self.redis.set(
-            key,
-            orjson.dumps([genre.model_dump_json() for genre in genres]),
-            settings.cache_expire_in_seconds,
+    def might_exist(self, index: str, id: str) -> bool:
+        """False only if the document is known not to exist."""
+        bloom_filter = self.bloom_filters.get(index)
+        return bloom_filter is None or id in bloom_filter
+
+    def _new_entry(
+        self, body: bytes, headers: dict[str, str] | None = None
+    ) -> CacheEntry:
+        headers = dict(headers or {})
+        if body:
+            ttl = settings.cache_expire_in_seconds
+            # hashed once per cache fill, hits reuse the stored tag
+            headers[ETAG_HEADER] = get_etag(body)
+        else:
+            ttl = settings.cache_not_found_expire_in_seconds
+        gzip_body, br_body = self.codec.compress(body)
+        return CacheEntry(
+            body=body,
+            fresh_until=time.time() + ttl,
+            headers=headers,
+            gzip_body=gzip_body,
+            br_body=br_body,
         )
 
-    async def _put_person_to_cache(self, person: Person):
-        key = f"person: {person.person_id}"
-        await self.redis.set(
-            key, person.json(), settings.cache_expire_in_seconds
+    @staticmethod
+    def _expire(body: bytes, fallback: int) -> int:
+        if not body:
+            return settings.cache_not_found_expire_in_seconds
+        return (
+            settings.cache_expire_in_seconds
+            + settings.cache_stale_in_seconds
+            + fallback
         )
 
-    async def _put_persons_to_cache(self, persons: list[Person], **kwargs):
-        key = f"persons: {await get_key_by_args(**kwargs)}"
-        await self.redis.set(
-            key,
-            orjson.dumps([person.json() for person in persons]),
-            settings.cache_expire_in_seconds,
-        )
+    @staticmethod
+    def is_expired(entry: CacheEntry) -> bool:
+        """The entry is past its stale window.
 
-    async def _person_from_cache(self, person_id: str) -> Person | None:
-        key = f"person: {person_id}"
-        data = await self.redis.get(key)
-        if not data:
-            return None
-        person = Person.parse_raw(data)
-        return person
+        Such entries are kept in Redis only to be served while
+        Elasticsearch is unavailable.
+        """
+        stale_until = entry.fresh_until + settings.cache_stale_in_seconds
+        return stale_until < time.time()
 
-    async def _persons_from_cache(self, **kwargs) -> list[Person] | None:
-        key = f"persons: {await get_key_by_args(**kwargs)}"
+    async def get(self, key: str) -> CacheEntry | None:
+        entry = self.local_cache.get(key)
+        if entry is not None:
+            return entry
         data = await self.redis.get(key)
         if not data:
             return None
-        return [Person.parse_raw(item) for item in orjson.loads(data)]
-
-    async def _put_films_by_person_to_cache(
-        self, person_id: str, films: list[FilmPreview], **kwargs
-    ):
-        key = f"films_by_person: {person_id}"
+        entry = self.codec.decode(data)
+        if entry is not None:
+            self.local_cache.set(key, entry)
+        return entry
+
+    async def get_many(self, keys: list[str]) -> list[CacheEntry | None]:
+        entries = [self.local_cache.get(key) for key in keys]
+        missing = [i for i, entry in enumerate(entries) if entry is None]
+        if not missing:
+            return entries
+        found = await self.redis.mget([keys[i] for i in missing])
+        for i, data in zip(missing, found):
+            entry = self.codec.decode(data) if data else None
+            if entry is not None:
+                entries[i] = entry
+                self.local_cache.set(keys[i], entry)
+        return entries
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+        fallback: int | None = None,
+    ) -> CacheEntry:
+        """Cache a response body.
+
+        After its stale window the entry is kept for fallback seconds,
+        CACHE_FALLBACK_IN_SECONDS by default, to be served while
+        Elasticsearch is unavailable.
+        """
+        if fallback is None:
+            fallback = settings.cache_fallback_in_seconds
+        entry = self._new_entry(body, headers)
+        self.local_cache.set(key, entry)
         await self.redis.set(
-            key,
-            orjson.dumps([film.json() for film in films]),
-            settings.cache_expire_in_seconds,
+            key, self.codec.encode(entry), self._expire(body, fallback)
         )
-
+        return entry
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, body in items.items():
+                entry = self._new_entry(body)
+                self.local_cache.set(key, entry)
+                pipe.set(
+                    key,
+                    self.codec.encode(entry),
+                    self._expire(body, settings.cache_fallback_in_seconds),
+                )
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.local_cache.delete(key)
+        await self.redis.delete(*keys)
+
+    @asynccontextmanager
+    async def lock(self, key: str) -> AsyncIterator[bool]:
+        """Cross-worker lock around a cache fill, if enabled.
+
+        Yields True when the lock was used, so the caller knows it
+        should re-check the cache before going to Elasticsearch.
+        """
+        if not settings.cache_lock_enabled:
+            yield False
+            return
+        lock = self.redis.lock(
+            f"lock: {key}",
+            timeout=settings.cache_lock_timeout_in_seconds,
+            blocking_timeout=settings.cache_lock_wait_in_seconds,
+        )
+        acquired = await lock.acquire()
+        try:
+            yield True
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except LockError:
+                    pass
 
 
 @lru_cache()
 def get_redis_service(
     redis: Redis = Depends(get_redis),
+    local_cache: LocalCache = Depends(get_local_cache),
+    codec: CacheCodec = Depends(get_cache_codec),
 ) -> RedisService:
-    return RedisService(redis)
+    return RedisService(redis, local_cache, codec)
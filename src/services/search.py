@@ -0,0 +1,32 @@
+from functools import lru_cache
+from fastapi import Depends
+from src.core.config import settings
+from src.services.base import BaseService
+from src.services.cache_entry import CacheEntry
+from src.services.elastic import ElasticService, get_elastic_service
+from src.services.redis import RedisService, get_redis_service
+
+
+class SearchService(BaseService):
+    async def search(self, **kwargs) -> CacheEntry:
+        """Films, persons and genres for a query, cached as one response."""
+        return await self._get_or_load(
+            self._list_key(
+                "search",
+                settings.movies_index_name,
+                settings.persons_index_name,
+                settings.genres_index_name,
+                **kwargs,
+            ),
+            lambda: self._elastic_service.get_search_results_from_elastic(
+                **kwargs
+            ),
+        )
+
+
+@lru_cache()
+def get_search_service(
+    redis_service: RedisService = Depends(get_redis_service),
+    elastic_service: ElasticService = Depends(get_elastic_service),
+) -> SearchService:
+    return SearchService(redis_service, elastic_service)
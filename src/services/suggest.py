@@ -0,0 +1,32 @@
+from functools import lru_cache
+from fastapi import Depends
+from src.core.config import settings
+from src.services.base import BaseService
+from src.services.cache_entry import CacheEntry
+from src.services.elastic import ElasticService, get_elastic_service
+from src.services.redis import RedisService, get_redis_service
+
+
+class SuggestService(BaseService):
+    async def suggest(self, query: str, size: int) -> CacheEntry:
+        key = self._list_key(
+            "suggest",
+            settings.movies_index_name,
+            settings.persons_index_name,
+            query=query,
+            size=size,
+        )
+        return await self._get_or_load(
+            key,
+            lambda: self._elastic_service.get_suggestions_from_elastic(
+                query, size
+            ),
+        )
+
+
+@lru_cache()
+def get_suggest_service(
+    redis_service: RedisService = Depends(get_redis_service),
+    elastic_service: ElasticService = Depends(get_elastic_service),
+) -> SuggestService:
+    return SuggestService(redis_service, elastic_service)
@@ -1,6 +1,62 @@
-import json
+from enum import Enum
+from hashlib import blake2b
 
+from orjson import orjson
+from pydantic import BaseModel
 
-async def get_key_by_args(*args, **kwargs) -> str:
-    """Get key by args and kwargs."""
-    return f'{args}:{json.dumps({"kwargs": kwargs}, sort_keys=True)}'
+from src.core.config import settings
+
+# full-text params: ES analyzers ignore their case and extra whitespace;
+# other params, e.g. the exact genre filter, are sent to ES as they are
+FULL_TEXT_PARAMS = {"query"}
+
+
+def _normalize_param(name: str, value):
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str) and name in FULL_TEXT_PARAMS:
+        value = " ".join(value.split()).casefold()
+    return value
+
+
+def get_params_hash(**params) -> str:
+    """Fixed-length hash of request params.
+
+    Params are normalized first, so semantically equal requests
+    (omitted vs None, different whitespace or case of a full-text
+    query) share the same hash.
+    """
+    normalized = {
+        name: _normalize_param(name, value) for name, value in params.items()
+    }
+    canonical = {
+        name: value
+        for name, value in normalized.items()
+        if value is not None and value != ""
+    }
+    return blake2b(
+        orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def get_cache_key(*parts: str) -> str:
+    """Cache key under the global cache version.
+
+    Bumping CACHE_VERSION makes every cached key unreachable at once.
+    """
+    return ":".join((settings.cache_version, *parts))
+
+
+def _dump_model(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError
+
+
+def dump_response(data) -> bytes:
+    """Serialize loaded data into a JSON response body.
+
+    ES sources come as validated plain dicts and are dumped by orjson
+    as they are; models, e.g. facets, are dumped on the way.
+    """
+    return orjson.dumps(data, default=_dump_model)
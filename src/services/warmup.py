@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable
+
+from orjson import orjson
+
+from src.core.config import settings
+from src.enums import FilmsSortOption
+from src.services.film import FilmService
+from src.services.genre import GenreService
+
+logger = logging.getLogger(__name__)
+
+GENRES_PAGE_SIZE = 100
+
+
+class CacheWarmer:
+    """Prefetches the hottest keys into the cache.
+
+    Warms the first pages of /films for every sort option and genre,
+    all genres and the top rated films by id.
+    """
+
+    def __init__(
+        self, film_service: FilmService, genre_service: GenreService
+    ) -> None:
+        self._film_service = film_service
+        self._genre_service = genre_service
+        self._task: asyncio.Task | None = None
+
+    def schedule(self) -> None:
+        """Start warming up in the background unless it is running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def run(self) -> None:
+        started = time.monotonic()
+        try:
+            genres = await self._warm_genres()
+            jobs = [self._warm_top_films()] + [
+                self._film_service.all(
+                    page_size=settings.warmup_page_size,
+                    page=page,
+                    sort=sort,
+                    genre=genre,
+                )
+                for sort in [None, *FilmsSortOption]
+                for genre in [None, *genres]
+                for page in range(1, settings.warmup_pages + 1)
+            ]
+            await self._run_bounded(jobs)
+        except Exception:
+            logger.exception("Cache warm-up failed")
+            return
+        logger.info(
+            "Cache warm-up finished in %.1fs", time.monotonic() - started
+        )
+
+    async def _warm_genres(self) -> list[str]:
+        genres = []
+        page = 1
+        while True:
+            genres_page = await self._genre_service.all(
+                page_size=GENRES_PAGE_SIZE, page=page
+            )
+            items = orjson.loads(genres_page.body)
+            genres.extend(genre["name"] for genre in items)
+            if len(items) < GENRES_PAGE_SIZE:
+                return genres
+            page += 1
+
+    async def _warm_top_films(self) -> None:
+        films = await self._film_service.all(
+            page_size=settings.warmup_top_films,
+            page=1,
+            sort=FilmsSortOption.desc,
+            genre=None,
+        )
+        films_ids = [film["id"] for film in orjson.loads(films.body)]
+        await self._film_service.get_many_by_id(films_ids)
+
+    async def _run_bounded(self, jobs: list[Awaitable]) -> None:
+        semaphore = asyncio.Semaphore(settings.warmup_concurrency)
+        done = 0
+        step = max(len(jobs) // 10, 1)
+
+        async def run_job(job: Awaitable) -> None:
+            nonlocal done
+            async with semaphore:
+                try:
+                    await job
+                except Exception:
+                    logger.exception("Cache warm-up job failed")
+            done += 1
+            if done % step == 0 or done == len(jobs):
+                logger.info("Cache warm-up: %s/%s keys", done, len(jobs))
+
+        await asyncio.gather(*(run_job(job) for job in jobs))
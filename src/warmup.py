@@ -0,0 +1,45 @@
+"""Warm up the API cache.
+
+Run from the project root: python -m src.warmup
+"""
+
+import asyncio
+
+from elasticsearch import AsyncElasticsearch
+from redis.asyncio import Redis
+
+from src.core.config import settings
+from src.services.codec import get_cache_codec
+from src.services.elastic import ElasticService, get_elastic_circuit_breaker
+from src.services.film import FilmService
+from src.services.genre import GenreService
+from src.services.local_cache import get_local_cache
+from src.services.redis import RedisService
+from src.services.warmup import CacheWarmer
+
+
+async def main() -> None:
+    redis = Redis(host=settings.redis_host, port=settings.redis_port)
+    elastic = AsyncElasticsearch(
+        hosts=[f"{settings.es_schema}{settings.es_host}:{settings.es_port}"]
+    )
+    try:
+        redis_service = RedisService(
+            redis, get_local_cache(), get_cache_codec()
+        )
+        await redis_service.load_versions()
+        elastic_service = ElasticService(
+            elastic, get_elastic_circuit_breaker()
+        )
+        warmer = CacheWarmer(
+            FilmService(redis_service, elastic_service),
+            GenreService(redis_service, elastic_service),
+        )
+        await warmer.run()
+    finally:
+        await redis.aclose()
+        await elastic.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
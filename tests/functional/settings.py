@@ -12,6 +12,9 @@ class TestSettings(BaseSettings):
     es_movies_index_name: str = Field("movies", alias="MOVIES_INDEX_NAME")
     es_persons_index_name: str = Field("persons", alias="PERSONS_INDEX_NAME")
     es_genres_index_name: str = Field("genres", alias="GENRES_INDEX_NAME")
+    cache_invalidation_channel: str = Field(
+        "cache_invalidation", alias="CACHE_INVALIDATION_CHANNEL"
+    )
 
     service_url: str = Field("http://fastapi:8000", alias="SERVICE_URL")
 
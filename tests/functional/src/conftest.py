@@ -1,8 +1,20 @@
 import pytest
 from pytest_asyncio import is_async_test
 
-from .fixtures.db import clear_cache, es_client, es_write_data, redis_client
-from .fixtures.requests import make_get_request
+from .fixtures.db import (
+    clear_cache,
+    es_client,
+    es_write_data,
+    publish_change,
+    redis_client,
+    wait_for_genre,
+)
+from .fixtures.requests import (
+    make_get_request,
+    make_get_request_with_headers,
+    make_ndjson_request,
+    make_post_request,
+)
 from .fixtures.testdata.films import films_data
 from .fixtures.testdata.genres import genres_data
 from .fixtures.testdata.persons import persons_data
@@ -1,3 +1,8 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import aiohttp
 import pytest_asyncio
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.helpers import async_bulk
@@ -32,8 +37,44 @@ async def clear_cache(redis_client: Redis):
     await redis_client.flushdb()
 
 
+@pytest_asyncio.fixture(name="publish_change", loop_scope="session")
+def publish_change(redis_client: Redis):
+    async def inner(index_name: str, ids: list[str]):
+        """Notify the API about changed documents, as the ETL does."""
+        version = await redis_client.incr(f"cache_version: {index_name}")
+        message = {
+            "index": index_name,
+            "ids": ids,
+            "version": version,
+            "full": False,
+        }
+        await redis_client.publish(
+            test_settings.cache_invalidation_channel, json.dumps(message)
+        )
+
+    return inner
+
+
+@pytest_asyncio.fixture(name="wait_for_genre", loop_scope="session")
+def wait_for_genre():
+    async def inner(genre_id: str, found: bool = True):
+        """Wait until the API has refreshed its genres snapshot."""
+        url = f"{test_settings.service_url}/api/v1/genres/{genre_id}"
+        async with aiohttp.ClientSession() as session:
+            for _ in range(50):
+                async with session.get(url) as response:
+                    if (response.status == HTTPStatus.OK) == found:
+                        return
+                await asyncio.sleep(0.1)
+        raise TimeoutError("Genres snapshot was not refreshed")
+
+    return inner
+
+
 @pytest_asyncio.fixture(name="es_write_data", loop_scope="session")
-def es_write_data(es_client: AsyncElasticsearch):
+def es_write_data(
+    es_client: AsyncElasticsearch, publish_change, wait_for_genre
+):
     async def inner(
         index_name: str, index: dict, id_field_name: str, data: list[dict]
     ):
@@ -52,4 +93,11 @@ def es_write_data(es_client: AsyncElasticsearch):
         if errors:
             raise Exception("Ошибка записи данных в Elasticsearch")
 
+        await publish_change(
+            index_name, [item[id_field_name] for item in data]
+        )
+        if index_name == test_settings.es_genres_index_name and data:
+            # the API reloads its in-memory genres on the change event
+            await wait_for_genre(data[0][id_field_name])
+
     return inner
@@ -1,3 +1,5 @@
+import json
+
 import aiohttp
 import pytest_asyncio
 
@@ -15,3 +17,57 @@ def make_get_request():
         return status, body
 
     return inner
+
+
+@pytest_asyncio.fixture(
+    name="make_get_request_with_headers", loop_scope="session"
+)
+def make_get_request_with_headers():
+    async def inner(
+        url_path: str,
+        query_data: dict | None = None,
+        headers: dict | None = None,
+    ):
+        async with aiohttp.ClientSession() as session:
+            url = test_settings.service_url + url_path
+            async with session.get(
+                url, params=query_data, headers=headers
+            ) as response:
+                status = response.status
+                headers = response.headers
+                # a 304 response has no body
+                body = await response.json(content_type=None)
+        return status, headers, body
+
+    return inner
+
+
+@pytest_asyncio.fixture(name="make_ndjson_request", loop_scope="session")
+def make_ndjson_request():
+    async def inner(url_path: str, query_data: dict | None = None):
+        async with aiohttp.ClientSession() as session:
+            url = test_settings.service_url + url_path
+            async with session.get(url, params=query_data) as response:
+                status = response.status
+                content_type = response.content_type
+                lines = [
+                    json.loads(line)
+                    async for line in response.content
+                    if line.strip()
+                ]
+        return status, content_type, lines
+
+    return inner
+
+
+@pytest_asyncio.fixture(name="make_post_request", loop_scope="session")
+def make_post_request():
+    async def inner(url_path: str, json_data: dict):
+        async with aiohttp.ClientSession() as session:
+            url = test_settings.service_url + url_path
+            async with session.post(url, json=json_data) as response:
+                status = response.status
+                body = await response.json()
+        return status, body
+
+    return inner
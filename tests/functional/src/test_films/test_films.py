@@ -50,6 +50,12 @@ async def test_films_pagination(
         ({"page": -5}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY}),
         ({"sort": 75}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY}),
         ({"sort": "qwe"}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY}),
+        ({"min_rating": -1}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY}),
+        ({"max_rating": 11}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY}),
+        (
+            {"min_rating": 9, "max_rating": 1},
+            {"status": HTTPStatus.UNPROCESSABLE_ENTITY},
+        ),
     ],
 )
 @pytest.mark.asyncio
@@ -128,6 +134,42 @@ async def test_films_genre_filtering(
     assert len(body) == expected_answer["length"]
 
 
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({"min_rating": 9}, {"status": HTTPStatus.OK, "length": 1}),
+        ({"max_rating": 1}, {"status": HTTPStatus.OK, "length": 1}),
+        (
+            {"min_rating": 5, "max_rating": 9, "genre": "Action"},
+            {"status": HTTPStatus.OK, "length": 10},
+        ),
+        (
+            {"min_rating": 9.5, "max_rating": 9.9},
+            {"status": HTTPStatus.OK, "length": 0},
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_rating_filtering(
+    films_data,
+    make_get_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    status, body = await make_get_request("/api/v1/films/", query_data)
+
+    assert status == expected_answer["status"]
+    assert len(body) == expected_answer["length"]
+
+
 @pytest.mark.asyncio
 async def test_film_by_id(
         films_data,
@@ -146,3 +188,329 @@ async def test_film_by_id(
     status, body = await make_get_request(f"/api/v1/films/{film_id}")
     assert film_id == body["id"]
     assert status == HTTPStatus.OK
+
+
+@pytest.mark.parametrize(
+    "url_path, query_data",
+    [
+        ("/api/v1/films/", {"page_size": 15}),
+        ("/api/v1/films/", {"page_size": 15, "sort": "-imdb_rating"}),
+        ("/api/v1/films/search/", {"page_size": 15, "query": "star"}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_cursor_pagination(
+    films_data,
+    make_get_request_with_headers,
+    es_write_data,
+    clear_cache,
+    url_path: str,
+    query_data: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    films_ids = []
+    params = dict(query_data)
+    while True:
+        status, headers, body = await make_get_request_with_headers(
+            url_path, params
+        )
+        assert status == HTTPStatus.OK
+        films_ids.extend(film["id"] for film in body)
+        if "X-Next-Cursor" not in headers:
+            break
+        params["cursor"] = headers["X-Next-Cursor"]
+
+    assert len(films_ids) == len(set(films_ids))
+    assert len(films_ids) == len(films_data)
+
+
+@pytest.mark.parametrize(
+    "query_data",
+    [
+        {"cursor": "qwe"},
+        {"cursor": "eyJhZnRlciI6W119"},
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_cursor_validation(
+    make_get_request,
+    query_data: dict,
+):
+    status, body = await make_get_request("/api/v1/films/", query_data)
+
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "url_path, query_data",
+    [
+        ("/api/v1/films/", {"sort": "-imdb_rating"}),
+        ("/api/v1/films/search/", {"query": "star"}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_cursor_sort_mismatch(
+    films_data,
+    make_get_request,
+    make_get_request_with_headers,
+    es_write_data,
+    clear_cache,
+    url_path: str,
+    query_data: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    status, headers, body = await make_get_request_with_headers(
+        "/api/v1/films/", {"page_size": 5}
+    )
+    assert status == HTTPStatus.OK
+
+    status, body = await make_get_request(
+        url_path, {**query_data, "cursor": headers["X-Next-Cursor"]}
+    )
+
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({}, {"total": 200, "Action": 200}),
+        ({"genre": "Comedy"}, {"total": 0, "Action": None}),
+        ({"min_rating": 9}, {"total": 1, "Action": 1}),
+        ({"query": "The Star", "max_rating": 1}, {"total": 1, "Action": 1}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_facets(
+    films_data,
+    make_get_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    status, body = await make_get_request("/api/v1/films/facets", query_data)
+    genres = {facet["genre"]: facet["count"] for facet in body["genres"]}
+
+    assert status == HTTPStatus.OK
+    assert body["total"] == expected_answer["total"]
+    assert genres.get("Action") == expected_answer["Action"]
+    assert len(body["ratings"]) == 11
+    assert sum(facet["count"] for facet in body["ratings"]) == body["total"]
+
+
+@pytest.mark.parametrize(
+    "url_path, query_data",
+    [
+        ("/api/v1/films/", {"page_size": 15, "sort": "-imdb_rating"}),
+        ("/api/v1/films/search/", {"query": "star"}),
+        ("/api/v1/films/facets", {}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_not_modified(
+    films_data,
+    make_get_request_with_headers,
+    es_write_data,
+    clear_cache,
+    url_path: str,
+    query_data: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    status, headers, _ = await make_get_request_with_headers(
+        url_path, query_data
+    )
+    etag = headers["ETag"]
+    assert status == HTTPStatus.OK
+    assert headers["Cache-Control"].startswith("public, max-age=")
+
+    status, headers, body = await make_get_request_with_headers(
+        url_path, query_data, headers={"If-None-Match": etag}
+    )
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert headers["ETag"] == etag
+    assert body is None
+
+    status, _, _ = await make_get_request_with_headers(
+        url_path, query_data, headers={"If-None-Match": '"outdated"'}
+    )
+    assert status == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_film_by_id_not_modified(
+    films_data,
+    make_get_request_with_headers,
+    es_write_data,
+    clear_cache,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    url_path = f"/api/v1/films/{films_data[0]['id']}"
+    _, headers, _ = await make_get_request_with_headers(url_path)
+
+    # nginx turns ETags of gzipped responses into weak ones
+    status, _, body = await make_get_request_with_headers(
+        url_path, headers={"If-None-Match": f"W/{headers['ETag']}"}
+    )
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert body is None
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({}, {"length": test_settings.test_data_amount, "fields": None}),
+        (
+            {"fields": ["id", "title", "actors"]},
+            {
+                "length": test_settings.test_data_amount,
+                "fields": {"id", "title", "actors"},
+            },
+        ),
+        (
+            {"changed_since": "2021-06-16T00:00:00Z"},
+            {"length": test_settings.test_data_amount, "fields": None},
+        ),
+        (
+            {"changed_since": "2021-06-17T00:00:00Z"},
+            {"length": 0, "fields": None},
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_export(
+    films_data,
+    make_ndjson_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    status, content_type, films = await make_ndjson_request(
+        "/api/v1/films/export", query_data
+    )
+
+    assert status == HTTPStatus.OK
+    assert content_type == "application/x-ndjson"
+    assert len(films) == expected_answer["length"]
+    assert len({film["id"] for film in films}) == len(films)
+    if expected_answer["fields"]:
+        assert all(set(film) == expected_answer["fields"] for film in films)
+
+
+@pytest.mark.asyncio
+async def test_films_export_validation(make_get_request):
+    status, _ = await make_get_request(
+        "/api/v1/films/export", {"fields": ["id", "unknown"]}
+    )
+
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+    ],
+)
+@pytest.mark.asyncio
+async def test_films_content_encoding(
+    films_data,
+    make_get_request_with_headers,
+    es_write_data,
+    clear_cache,
+    accept_encoding: str,
+    expected_encoding: str | None,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    for _ in range(2):
+        # the first request fills the cache, the second one is a hit
+        status, headers, body = await make_get_request_with_headers(
+            "/api/v1/films/",
+            {"page_size": 100},
+            headers={"Accept-Encoding": accept_encoding},
+        )
+
+        assert status == HTTPStatus.OK
+        assert headers.get("Content-Encoding") == expected_encoding
+        assert headers["Vary"] == "Accept-Encoding"
+        assert len(body) == 100
+
+
+@pytest.mark.asyncio
+async def test_films_batch(
+    films_data,
+    make_post_request,
+    es_write_data,
+    clear_cache,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    ids = [films_data[1]["id"], "unknown", films_data[0]["id"]]
+    for _ in range(2):
+        # the first request fills the cache, the second one is served from it
+        status, body = await make_post_request(
+            "/api/v1/films/batch", {"ids": ids}
+        )
+
+        assert status == HTTPStatus.OK
+        assert [item["id"] for item in body] == ids
+        assert [item["found"] for item in body] == [True, False, True]
+        assert body[0]["item"]["id"] == ids[0]
+        assert "item" not in body[1]
+
+
+@pytest.mark.parametrize(
+    "json_data",
+    [{}, {"ids": []}, {"ids": ["id"] * 101}],
+)
+@pytest.mark.asyncio
+async def test_films_batch_validation(make_post_request, json_data: dict):
+    status, _ = await make_post_request("/api/v1/films/batch", json_data)
+
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -97,3 +97,69 @@ async def test_genre_not_found(
 ):
     status, body = await make_get_request("/api/v1/genres/non_existent_id")
     assert status == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_genres_snapshot(
+    genres_data,
+    make_get_request,
+    es_client,
+    redis_client,
+    es_write_data,
+    publish_change,
+    wait_for_genre,
+    clear_cache,
+):
+    await es_write_data(
+        index_name=test_settings.es_genres_index_name,
+        index=genres_index,
+        id_field_name="id",
+        data=genres_data,
+    )
+    genre_id = genres_data[0]["id"]
+    await es_client.indices.delete(index=test_settings.es_genres_index_name)
+    await redis_client.flushdb()
+
+    # served from memory, without Redis and the index
+    status, body = await make_get_request(f"/api/v1/genres/{genre_id}")
+    assert status == HTTPStatus.OK
+
+    await publish_change(test_settings.es_genres_index_name, [genre_id])
+    # another id: the not found answer is cached
+    await wait_for_genre(genres_data[1]["id"], found=False)
+    await es_client.index(
+        index=test_settings.es_genres_index_name,
+        id=genre_id,
+        document=genres_data[0],
+        refresh=True,
+    )
+    await redis_client.flushdb()
+
+    # without the index the snapshot is dropped, not left empty
+    status, body = await make_get_request(f"/api/v1/genres/{genre_id}")
+    assert status == HTTPStatus.OK
+    assert body["id"] == genre_id
+
+
+@pytest.mark.asyncio
+async def test_genres_batch(
+    genres_data,
+    make_post_request,
+    es_write_data,
+    clear_cache,
+):
+    await es_write_data(
+        index_name=test_settings.es_genres_index_name,
+        index=genres_index,
+        id_field_name="id",
+        data=genres_data,
+    )
+    ids = ["unknown", genres_data[0]["id"]]
+    status, body = await make_post_request(
+        "/api/v1/genres/batch", {"ids": ids}
+    )
+
+    assert status == HTTPStatus.OK
+    assert [item["id"] for item in body] == ids
+    assert [item["found"] for item in body] == [False, True]
+    assert body[1]["item"]["name"] == genres_data[0]["name"]
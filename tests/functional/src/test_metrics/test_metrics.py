@@ -0,0 +1,12 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_metrics(make_get_request):
+    status, body = await make_get_request("/api/v1/metrics/")
+
+    assert status == HTTPStatus.OK
+    assert body["elasticsearch_circuit_breaker"]["state"] == "closed"
+    assert "hits" in body["local_cache"]
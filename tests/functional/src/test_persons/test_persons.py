@@ -1,3 +1,4 @@
+import uuid
 from http import HTTPStatus
 
 import pytest
@@ -27,6 +28,89 @@ async def test_person_film(
     assert film_id == body[0]["id"]
 
 
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({}, {"ratings": [5.0, None, 9.0, 7.0]}),
+        ({"sort": "-imdb_rating"}, {"ratings": [9.0, 7.0, 5.0, None]}),
+        ({"sort": "imdb_rating"}, {"ratings": [5.0, 7.0, 9.0, None]}),
+        (
+            {"sort": "imdb_rating", "page_size": 2, "page": 2},
+            {"ratings": [9.0, None]},
+        ),
+        ({"page_size": 2, "page": 3}, {"ratings": []}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_person_film_sorting_and_pagination(
+    make_get_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    person = {
+        "person_id": str(uuid.uuid4()),
+        "full_name": "Mark Hamill",
+        "films": [
+            {
+                "id": str(uuid.uuid4()),
+                "roles": ["actor"],
+                "title": "The Star",
+                "imdb_rating": rating,
+            }
+            for rating in (5.0, None, 9.0, 7.0)
+        ],
+    }
+    await es_write_data(
+        index_name=test_settings.es_persons_index_name,
+        index=persons_index,
+        id_field_name="person_id",
+        data=[person],
+    )
+    status, body = await make_get_request(
+        f"/api/v1/persons/{person['person_id']}/film", query_data
+    )
+
+    assert status == HTTPStatus.OK
+    assert [film["imdb_rating"] for film in body] == expected_answer[
+        "ratings"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_person_film_without_page_size(
+    make_get_request,
+    es_write_data,
+    clear_cache,
+):
+    person = {
+        "person_id": str(uuid.uuid4()),
+        "full_name": "Mark Hamill",
+        "films": [
+            {
+                "id": str(uuid.uuid4()),
+                "roles": ["actor"],
+                "title": "The Star",
+                "imdb_rating": 5.0,
+            }
+            for _ in range(120)
+        ],
+    }
+    await es_write_data(
+        index_name=test_settings.es_persons_index_name,
+        index=persons_index,
+        id_field_name="person_id",
+        data=[person],
+    )
+    status, body = await make_get_request(
+        f"/api/v1/persons/{person['person_id']}/film"
+    )
+
+    assert status == HTTPStatus.OK
+    assert len(body) == len(person["films"])
+
+
 @pytest.mark.asyncio
 async def test_person_by_id(
     persons_data,
@@ -64,3 +148,25 @@ async def test_person_not_found(
     status, body = await make_get_request("/api/v1/persons/non_existent_id")
     assert status == HTTPStatus.NOT_FOUND
 
+
+@pytest.mark.asyncio
+async def test_persons_batch(
+    persons_data,
+    make_post_request,
+    es_write_data,
+    clear_cache,
+):
+    await es_write_data(
+        index_name=test_settings.es_persons_index_name,
+        index=persons_index,
+        id_field_name="person_id",
+        data=persons_data,
+    )
+    ids = [persons_data[0]["person_id"], "non_existent_id"]
+    status, body = await make_post_request(
+        "/api/v1/persons/batch", {"ids": ids}
+    )
+
+    assert status == HTTPStatus.OK
+    assert [item["found"] for item in body] == [True, False]
+    assert body[0]["item"]["person_id"] == ids[0]
@@ -3,6 +3,7 @@ from http import HTTPStatus
 import pytest
 
 from tests.functional.settings import test_settings
+from tests.functional.testdata.es_schemes.genres_index import genres_index
 from tests.functional.testdata.es_schemes.movies_index import movies_index
 from tests.functional.testdata.es_schemes.persons_index import persons_index
 
@@ -92,3 +93,51 @@ async def test_films_partial_search(
     assert status == HTTPStatus.OK
     assert len(body) == expected_length
 
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        (
+            {"query": "The Star", "page_size": 5},
+            {"films": 5, "persons": 0, "genres": 0},
+        ),
+        ({"query": "Carrie"}, {"films": 0, "persons": 10, "genres": 0}),
+        ({"query": "Western"}, {"films": 0, "persons": 0, "genres": 1}),
+        ({"query": "Mashed potato"}, {"films": 0, "persons": 0, "genres": 0}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_search_all(
+    films_data,
+    persons_data,
+    genres_data,
+    make_get_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    await es_write_data(
+        index_name=test_settings.es_persons_index_name,
+        index=persons_index,
+        id_field_name="person_id",
+        data=persons_data,
+    )
+    await es_write_data(
+        index_name=test_settings.es_genres_index_name,
+        index=genres_index,
+        id_field_name="id",
+        data=genres_data,
+    )
+    status, body = await make_get_request("/api/v1/search/", query_data)
+
+    assert status == HTTPStatus.OK
+    assert len(body["films"]) == expected_answer["films"]
+    assert len(body["persons"]) == expected_answer["persons"]
+    assert len(body["genres"]) == expected_answer["genres"]
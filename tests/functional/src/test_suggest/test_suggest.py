@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.functional.settings import test_settings
+from tests.functional.testdata.es_schemes.movies_index import movies_index
+from tests.functional.testdata.es_schemes.persons_index import persons_index
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({"query": "The St"}, {"films": 5, "persons": 0}),
+        ({"query": "carr", "size": 3}, {"films": 0, "persons": 3}),
+        ({"query": "Carrie Fi"}, {"films": 0, "persons": 5}),
+        ({"query": "Mashed"}, {"films": 0, "persons": 0}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_suggest(
+    films_data,
+    persons_data,
+    make_get_request,
+    es_write_data,
+    clear_cache,
+    query_data: dict,
+    expected_answer: dict,
+):
+    await es_write_data(
+        index_name=test_settings.es_movies_index_name,
+        index=movies_index,
+        id_field_name="id",
+        data=films_data,
+    )
+    await es_write_data(
+        index_name=test_settings.es_persons_index_name,
+        index=persons_index,
+        id_field_name="person_id",
+        data=persons_data,
+    )
+    status, body = await make_get_request("/api/v1/suggest/", query_data)
+
+    assert status == HTTPStatus.OK
+    assert len(body["films"]) == expected_answer["films"]
+    assert len(body["persons"]) == expected_answer["persons"]
+
+
+@pytest.mark.parametrize(
+    "query_data",
+    [
+        {},
+        {"query": ""},
+        {"query": "star", "size": 0},
+        {"query": "star", "size": 11},
+    ],
+)
+@pytest.mark.asyncio
+async def test_suggest_validation(make_get_request, query_data: dict):
+    status, body = await make_get_request("/api/v1/suggest/", query_data)
+
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -48,6 +48,9 @@ movies_index = {
       "imdb_rating": {
         "type": "float"
       },
+      "modified": {
+        "type": "date"
+      },
       "genres": {
         "type": "keyword"
       },
@@ -57,6 +60,9 @@ movies_index = {
         "fields": {
           "raw": {
             "type":  "keyword"
+          },
+          "suggest": {
+            "type": "search_as_you_type"
           }
         }
       },
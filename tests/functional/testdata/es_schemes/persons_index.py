@@ -29,8 +29,11 @@ persons_index = {
     },
     "mappings": {
         "properties": {
-            "id": {"type": "keyword"},
-            "full_name": {"type": "text"},
+            "person_id": {"type": "keyword"},
+            "full_name": {
+                "type": "text",
+                "fields": {"suggest": {"type": "search_as_you_type"}},
+            },
             "films": {
                 "type": "nested",
                 "dynamic": "strict",
@@ -11,6 +11,7 @@ films = [
         "title": "The Star",
         "description": "New World",
         "url": None,
+        "modified": "2021-06-16T20:14:09+00:00",
         "directors_names": ["Stan"],
         "actors_names": ["Ann", "Bob"],
         "writers_names": ["Ben", "Howard"],
@@ -8,7 +8,15 @@ persons = [
     {
         "person_id": str(uuid.uuid4()),
         "full_name": "Carrie Fisher",
-        "films": [{"id": film["id"], "roles": ["actor"]} for film in films],
+        "films": [
+            {
+                "id": film["id"],
+                "roles": ["actor"],
+                "title": film["title"],
+                "imdb_rating": film["imdb_rating"],
+            }
+            for film in films
+        ],
     }
     for _ in range(test_settings.test_data_amount)
 ]
@@ -0,0 +1,55 @@
+import pytest
+
+from src.core.config import settings
+from src.enums.sort import FilmsSortOption
+from src.services.utils import get_cache_key, get_params_hash
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["star wars", "Star Wars", "  star   WARS ", "star\twars\n"],
+)
+def test_query_case_and_whitespace_are_ignored(query):
+    assert get_params_hash(query=query) == get_params_hash(query="star wars")
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"genre": None}, {"genre": ""}, {"query": None, "genre": ""}],
+)
+def test_empty_params_are_ignored(params):
+    assert get_params_hash(page_number=1, **params) == get_params_hash(
+        page_number=1
+    )
+
+
+def test_enum_and_its_value_are_equal():
+    assert get_params_hash(sort=FilmsSortOption.desc) == get_params_hash(
+        sort="-imdb_rating"
+    )
+
+
+def test_params_order_is_ignored():
+    assert get_params_hash(
+        page_number=1, page_size=50, sort="imdb_rating"
+    ) == get_params_hash(sort="imdb_rating", page_size=50, page_number=1)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"genre": "Comedy"},
+        {"genre": "action"},
+        {"genre": " Action"},
+        {"genre": "Action", "page_number": 2},
+        {"genre": "Action", "sort": FilmsSortOption.asc},
+    ],
+)
+def test_different_filters_are_not_equal(params):
+    assert get_params_hash(**params) != get_params_hash(genre="Action")
+
+
+def test_cache_key_is_under_cache_version():
+    assert get_cache_key("movies", "abc") == (
+        f"{settings.cache_version}:movies:abc"
+    )
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from src.services import circuit_breaker
+from src.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class BackendError(Exception):
+    pass
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "test",
+        failure_threshold=2,
+        reset_timeout=30,
+        is_failure=lambda exc: isinstance(exc, BackendError),
+    )
+
+
+async def ok():
+    return "ok"
+
+
+async def fail():
+    raise BackendError
+
+
+async def bad_request():
+    raise ValueError
+
+
+@pytest.mark.anyio
+async def test_opens_after_consecutive_failures(breaker):
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            await breaker.call(fail)
+
+    assert breaker.state == CircuitState.open
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(ok)
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.stats()["opened"] == 1
+
+
+@pytest.mark.anyio
+async def test_success_resets_failures(breaker):
+    with pytest.raises(BackendError):
+        await breaker.call(fail)
+    assert await breaker.call(ok) == "ok"
+    with pytest.raises(BackendError):
+        await breaker.call(fail)
+
+    assert breaker.state == CircuitState.closed
+
+
+@pytest.mark.anyio
+async def test_request_errors_are_not_failures(breaker):
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await breaker.call(bad_request)
+
+    assert breaker.state == CircuitState.closed
+
+
+@pytest.mark.anyio
+async def test_half_open_probe_closes(breaker, clock):
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            await breaker.call(fail)
+    assert breaker.retry_after == 30
+
+    clock.now += 30
+    assert breaker.state == CircuitState.half_open
+    assert await breaker.call(ok) == "ok"
+
+    assert breaker.state == CircuitState.closed
+    assert breaker.stats()["consecutive_failures"] == 0
+
+
+@pytest.mark.anyio
+async def test_half_open_probe_failure_opens(breaker, clock):
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            await breaker.call(fail)
+
+    clock.now += 30
+    with pytest.raises(BackendError):
+        await breaker.call(fail)
+
+    assert breaker.state == CircuitState.open
+    assert breaker.stats()["opened"] == 2
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(ok)
+
+
+@pytest.mark.anyio
+async def test_half_open_lets_one_probe_through(breaker, clock):
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            await breaker.call(fail)
+    clock.now += 30
+
+    async def probe():
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(ok)
+        return "probe"
+
+    assert await breaker.call(probe) == "probe"
+    assert breaker.state == CircuitState.closed
+
+
+@pytest.mark.anyio
+async def test_late_success_does_not_close_open_circuit(breaker, clock):
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "slow"
+
+    slow_call = asyncio.create_task(breaker.call(slow))
+    await asyncio.sleep(0)
+    for _ in range(2):
+        with pytest.raises(BackendError):
+            await breaker.call(fail)
+    release.set()
+
+    assert await slow_call == "slow"
+    assert breaker.state == CircuitState.open
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(ok)
+
+    clock.now += 30
+    assert await breaker.call(ok) == "ok"
+    assert breaker.state == CircuitState.closed
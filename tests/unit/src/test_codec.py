@@ -0,0 +1,90 @@
+import gzip
+
+import brotli
+import pytest
+
+from src.services.cache_entry import CacheEntry
+from src.services.codec import FORMAT_VERSION, CacheCodec
+
+SMALL_BODY = b'{"id":"1","title":"The Star"}'
+LARGE_BODY = b"[" + b",".join([SMALL_BODY] * 100) + b"]"
+
+
+@pytest.fixture
+def codec():
+    return CacheCodec(min_size=1024, level=1, br_quality=4)
+
+
+def test_small_body_round_trip(codec):
+    entry = CacheEntry(body=SMALL_BODY, fresh_until=1700000000.5)
+
+    decoded = codec.decode(codec.encode(entry))
+
+    assert decoded == entry
+    assert decoded.gzip_body is None
+    assert decoded.br_body is None
+
+
+def test_large_body_round_trip(codec):
+    entry = CacheEntry(body=LARGE_BODY, fresh_until=1700000000.5)
+
+    encoded = codec.encode(entry)
+    decoded = codec.decode(encoded)
+
+    assert decoded.body == LARGE_BODY
+    assert decoded.fresh_until == entry.fresh_until
+    assert gzip.decompress(decoded.gzip_body) == LARGE_BODY
+    assert brotli.decompress(decoded.br_body) == LARGE_BODY
+    assert len(encoded) < len(LARGE_BODY)
+
+
+def test_stored_variants_are_reused(codec):
+    gzip_body, br_body = codec.compress(LARGE_BODY)
+    entry = CacheEntry(
+        body=LARGE_BODY,
+        fresh_until=0,
+        gzip_body=gzip_body,
+        br_body=br_body,
+    )
+
+    decoded = codec.decode(codec.encode(entry))
+
+    assert decoded.gzip_body == gzip_body
+    assert decoded.br_body == br_body
+
+
+def test_brotli_is_optional():
+    codec = CacheCodec(min_size=1024, level=1)
+    entry = CacheEntry(body=LARGE_BODY, fresh_until=0)
+
+    decoded = codec.decode(codec.encode(entry))
+
+    assert decoded.body == LARGE_BODY
+    assert decoded.gzip_body is not None
+    assert decoded.br_body is None
+
+
+def test_headers_round_trip(codec):
+    headers = {"ETag": '"abc"', "X-Next-Cursor": "cursor"}
+    for body in (SMALL_BODY, LARGE_BODY):
+        entry = CacheEntry(body=body, fresh_until=0, headers=headers)
+
+        assert codec.decode(codec.encode(entry)).headers == headers
+
+
+def test_tombstone_round_trip(codec):
+    entry = CacheEntry(body=b"", fresh_until=0)
+
+    assert codec.decode(codec.encode(entry)).is_not_found
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        bytes([FORMAT_VERSION - 1]) + b"\x00" * 32,
+        b'{"legacy": "json"}',
+        b"",
+    ],
+)
+def test_other_formats_are_a_miss(codec, data):
+    assert codec.decode(data) is None
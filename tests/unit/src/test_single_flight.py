@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from src.services.single_flight import SingleFlight
+
+
+class BackendError(Exception):
+    pass
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    waiters = [
+        asyncio.create_task(single_flight.do("key", load)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert "key" in single_flight
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["value"] * 5
+    assert calls == 1
+    assert "key" not in single_flight
+
+
+@pytest.mark.anyio
+async def test_error_is_raised_to_every_waiter():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise BackendError
+
+    waiters = [
+        asyncio.create_task(single_flight.do("key", load)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, BackendError) for result in results)
+    assert calls == 1
+    assert "key" not in single_flight
+
+
+@pytest.mark.anyio
+async def test_next_call_after_completion_is_not_coalesced():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.do("key", load) == 1
+    assert await single_flight.do("key", load) == 2
+
+
+@pytest.mark.anyio
+async def test_different_keys_are_not_coalesced():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load(value):
+        await release.wait()
+        return value
+
+    waiters = [
+        asyncio.create_task(single_flight.do(key, lambda key=key: load(key)))
+        for key in ("a", "b")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["a", "b"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_cancel_the_call():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "value"
+
+    cancelled = asyncio.create_task(single_flight.do("key", load))
+    waiter = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "value"
+    assert cancelled.cancelled()